@@ -2,14 +2,19 @@
 """Hot-reload development runner for Arcade simulation.
 
 Watches physics_sim modules for changes and automatically restarts the window.
+Restarts are debounced on the trailing edge: a burst of saves (formatter run,
+git checkout, ...) restarts the window once, after the burst has gone quiet.
 """
 
+import asyncio
 import json
 import logging
+import multiprocessing
 import os
+import signal
 from pathlib import Path
 
-from watchfiles import run_process
+from watchfiles import Change, DefaultFilter, awatch
 
 logger = logging.getLogger("DevReloader")
 handler = logging.StreamHandler()
@@ -19,21 +24,35 @@ logger.setLevel(logging.INFO)
 
 logging.getLogger("watchfiles").setLevel(logging.WARNING)
 
+# Restart only after the change stream has been silent for this long
+QUIET_MS: int = 300
+# Time the simulation gets to exit on SIGINT before it is terminated
+STOP_GRACE_S: float = 0.5
+
+
+class SourceFilter(DefaultFilter):
+    """Default watchfiles filter that also drops directory mtime updates."""
+
+    def __call__(self, change: Change, path: str) -> bool:
+        if change == Change.modified and os.path.isdir(path):
+            return False
+        return super().__call__(change, path)
+
 
 def on_changes(changes):
     """Callback when files change."""
-    logger.info(f"🔄 Files changed: {len(changes)} file(s)")
+    logger.info("🔄 Files changed: %s file(s)", len(changes))
     for change_type, file_path in changes:
-        logger.debug(f"  {change_type}: {file_path}")
+        logger.debug("  %s: %s", change_type, file_path)
 
 
 def run_simulation():
-    """Run the simulation (called in subprocess by run_process)."""
+    """Run the simulation (called in subprocess by start_simulation)."""
     changes = os.getenv("WATCHFILES_CHANGES", "[]")
     changes = json.loads(changes)
 
     if changes:
-        logger.info(f"▶️  Restarting due to {len(changes)} change(s)")
+        logger.info("▶️  Restarting due to %s change(s)", len(changes))
     else:
         logger.info("▶️  Starting simulation...")
 
@@ -42,6 +61,84 @@ def run_simulation():
     main()
 
 
+def start_simulation(changes: set[tuple[Change, str]]) -> multiprocessing.Process:
+    """Spawn a fresh interpreter running the simulation."""
+    os.environ["WATCHFILES_CHANGES"] = json.dumps(
+        [[change.raw_str(), path] for change, path in changes]
+    )
+    process = multiprocessing.get_context("spawn").Process(target=run_simulation)
+    process.start()
+    return process
+
+
+def stop_simulation(process: multiprocessing.Process) -> None:
+    """Stop the simulation, escalating from SIGINT to terminate/kill."""
+    if process.is_alive():
+        os.kill(process.pid, signal.SIGINT)
+        process.join(STOP_GRACE_S)
+    if process.is_alive():
+        process.terminate()
+        process.join(STOP_GRACE_S)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+async def watch(watch_path: Path, quiet_ms: int = QUIET_MS) -> None:
+    """Restart the simulation once per burst of file changes."""
+    queue: asyncio.Queue[set[tuple[Change, str]]] = asyncio.Queue()
+
+    async def collect_changes():
+        async for changes in awatch(
+            watch_path,
+            watch_filter=SourceFilter(),
+            debounce=50,
+            step=10,
+            force_polling=False,
+        ):
+            await queue.put(changes)
+
+    collector = asyncio.create_task(collect_changes())
+
+    async def next_changes(timeout: float | None) -> set[tuple[Change, str]] | None:
+        # Next batch of changes, or None after timeout seconds of quiet. The
+        # queue is raced against the collector, so a watcher that fails or
+        # stops raises here instead of leaving the loop waiting forever.
+        getter = asyncio.ensure_future(queue.get())
+        done, _ = await asyncio.wait(
+            {getter, collector}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        if getter in done:
+            return getter.result()
+        getter.cancel()
+        if collector in done:
+            # Re-raises the watcher's own error, if it had one
+            collector.result()
+            raise RuntimeError(f"Stopped watching {watch_path}")
+        return None
+
+    process = start_simulation(set())
+    reload_count = 0
+    try:
+        while True:
+            pending = await next_changes(None)
+            # Every new event restarts the quiet timer
+            while True:
+                changes = await next_changes(quiet_ms / 1000)
+                if changes is None:
+                    break
+                pending |= changes
+
+            on_changes(pending)
+            stop_simulation(process)
+            process = start_simulation(pending)
+            reload_count += 1
+    finally:
+        collector.cancel()
+        stop_simulation(process)
+        logger.info("✓ Exited cleanly after %s reload(s)", reload_count)
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("🚀 Dev Mode: Auto-restart on file changes")
@@ -52,13 +149,6 @@ if __name__ == "__main__":
     watch_path = Path.cwd() / "physics_sim"
 
     try:
-        reload_count = run_process(
-            str(watch_path),
-            target=run_simulation,
-            callback=on_changes,
-            debounce=1600,
-            grace_period=0.5,
-        )
-        logger.info(f"✓ Exited cleanly after {reload_count} reload(s)")
+        asyncio.run(watch(watch_path))
     except KeyboardInterrupt:
         logger.info("\n👋 Shutting down dev mode")
@@ -3,6 +3,7 @@
 ###
 
 import logging
+import os
 
 import arcade
 
@@ -12,19 +13,18 @@ from physics_sim import (
     Simulator,
 )
 
-# Configure logging
+# Configure logging (e.g. PHYSICS_LOG_LEVEL=DEBUG for verbose output)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get("PHYSICS_LOG_LEVEL", "WARNING").upper(),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     datefmt="%H:%M:%S",
 )
 
 
 def main():
-    # Create configuration
-    config = SimulationConfig.from_screen_size(
-        arcade.get_display_size()[0], arcade.get_display_size()[1]
-    )
+    # Create configuration (query the windowing system once)
+    screen_width, screen_height = arcade.get_display_size()
+    config = SimulationConfig.from_screen_size(screen_width, screen_height)
 
     # Create engine
     engine = NumpyPhysicsEngine(
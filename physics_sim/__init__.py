@@ -17,23 +17,44 @@ __all__: list[str] = [
     "Simulator",
 ]
 
+import importlib
+from typing import Any
+
 from physics_sim.core import (
     Entity,
     Force,
     PhysicalEntity,
     PhysicsEngine,
     Renderer,
-
 )
-from physics_sim.engines import NumpyPhysicsEngine
-from physics_sim.entities import Ball, CircleObstacle, RectangleObstacle
-from physics_sim.forces import DragForce, LinearGravityForce
-from physics_sim.simulation.config import SimulationConfig
 
-try:
-    from physics_sim.rendering import ArcadeRenderer
-    from physics_sim.simulation.simulator import Simulator
-    from physics_sim.ui import ControlPanel, InventoryPanel
-except ImportError:
-    # Arcade not installed - these will be imported when needed
-    pass
+# Everything beyond the core interfaces is resolved on first access
+# (PEP 562): the engine, entities and forces load only when used, and
+# arcade/UI names never load for engine-only or headless use.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "NumpyPhysicsEngine": ("physics_sim.engines", "NumpyPhysicsEngine"),
+    "Ball": ("physics_sim.entities", "Ball"),
+    "RectangleObstacle": ("physics_sim.entities", "RectangleObstacle"),
+    "CircleObstacle": ("physics_sim.entities", "CircleObstacle"),
+    "LinearGravityForce": ("physics_sim.forces", "LinearGravityForce"),
+    "DragForce": ("physics_sim.forces", "DragForce"),
+    "SimulationConfig": ("physics_sim.simulation.config", "SimulationConfig"),
+    "ArcadeRenderer": ("physics_sim.rendering", "ArcadeRenderer"),
+    "Simulator": ("physics_sim.simulation.simulator", "Simulator"),
+    "InventoryPanel": ("physics_sim.ui.sections", "InventoryPanelSection"),
+    "ControlPanel": ("physics_sim.ui.sections", "ControlPanelSection"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,12 +3,13 @@ __all__: list[str] = [
     "PhysicalEntity",
     "PhysicsEngine",
     "Force",
+    "ForceKernel",
     "Renderer",
     "LayoutRegion",
 ]
 
 from .engine import PhysicsEngine
 from .entity import Entity, PhysicalEntity
-from .force import Force
+from .force import Force, ForceKernel
 from .renderer import Renderer
 from .layout_region import LayoutRegion
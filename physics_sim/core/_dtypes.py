@@ -0,0 +1,17 @@
+"""Floating-point dtype of the simulation state.
+
+Entity state, force outputs and the engines' per-entity arrays all use
+``STATE_DTYPE``. Single precision keeps positions accurate to ~1e-7 sim units,
+far below pixel resolution, at half the bytes per scan. Reductions whose
+result should stay stable over a long run (energies) accumulate in
+``ACCUM_DTYPE`` instead.
+
+The Numba kernels spell the same type as ``f4`` in their signatures.
+"""
+
+import numpy as np
+
+__all__: list[str] = ["ACCUM_DTYPE", "STATE_DTYPE"]
+
+STATE_DTYPE = np.float32
+ACCUM_DTYPE = np.float64
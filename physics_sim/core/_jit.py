@@ -0,0 +1,27 @@
+"""Optional Numba support for compiled kernels.
+
+Numba is an optional dependency (``pip install physics-sim[jit]``). Without
+it ``njit`` leaves functions as plain Python and ``prange`` is ``range``, so
+kernels stay importable; callers check ``NUMBA_AVAILABLE`` and keep a NumPy
+path for that case.
+
+Kernels are declared with explicit signatures, so they compile eagerly when
+their module is imported (or load from the ``cache=True`` on-disk cache)
+rather than on the first simulation step.
+"""
+
+__all__: list[str] = ["NUMBA_AVAILABLE", "njit", "prange"]
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Supports both @njit and @njit(...) forms
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
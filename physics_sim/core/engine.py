@@ -4,7 +4,7 @@ from typing import Any
 import numpy as np
 
 from .entity import Entity
-from .force import Force
+from .force import Force, ForceKernel
 
 
 class PhysicsEngine(ABC):
@@ -23,7 +23,13 @@ class PhysicsEngine(ABC):
         """
         self.bounds = bounds
         self.friction_enabled = friction_enabled
-        self.forces: list[Force] = []  # List of Force instances
+        # Force instances keyed by id(), in insertion order
+        self.forces: dict[int, Force] = {}
+        # Snapshot of self.forces.values() iterated by the step loop
+        self._forces_tuple: tuple[Force, ...] = ()
+        # Bumped on every change to the simulation or its force set; engines
+        # may key cached exports on it
+        self._state_version: int = 0
 
     @abstractmethod
     def add_entity(self, entity: Entity) -> None:
@@ -31,7 +37,7 @@ class PhysicsEngine(ABC):
         pass
 
     @abstractmethod
-    def remove_entity(self, entity_id: str) -> None:
+    def remove_entity(self, entity_id: int) -> None:
         """Remove an entity from the physics simulation."""
         pass
 
@@ -48,10 +54,27 @@ class PhysicsEngine(ABC):
     def add_force(self, force) -> None:
         """Add a force to the simulation.
 
+        Adding an instance that is already registered is a no-op.
+
         Args:
             force: Force instance to add
+
+        Raises:
+            TypeError: If the object does not implement apply_force
+            ValueError: If the force type is unique and already registered
         """
-        self.forces.append(force)
+        if not isinstance(force, ForceKernel):
+            raise TypeError(f"{type(force).__name__} does not implement apply_force")
+        if id(force) in self.forces:
+            return
+        force_type = type(force)
+        if force_type.is_unique() and any(
+            type(existing) is force_type for existing in self._forces_tuple
+        ):
+            raise ValueError(f"{force_type.get_name()} is already active")
+        self.forces[id(force)] = force
+        self._forces_tuple = tuple(self.forces.values())
+        self._state_version += 1
 
     def remove_force(self, force) -> None:
         """Remove a force from the simulation.
@@ -59,16 +82,19 @@ class PhysicsEngine(ABC):
         Args:
             force: Force instance to remove
         """
-        if force in self.forces:
-            self.forces.remove(force)
+        if self.forces.pop(id(force), None) is not None:
+            self._forces_tuple = tuple(self.forces.values())
+            self._state_version += 1
 
     def get_forces(self) -> list:
         """Get all forces that apply"""
-        return self.forces
+        return list(self._forces_tuple)
 
     def clear_forces(self) -> None:
         """Remove all forces from the simulation."""
         self.forces.clear()
+        self._forces_tuple = ()
+        self._state_version += 1
 
     @abstractmethod
     def pause(self) -> None:
@@ -100,6 +126,9 @@ class PhysicsEngine(ABC):
                 - position: (x, y) tuple
                 - render_type: 'circle', 'rectangle', etc.
                 - type-specific: radius, width, height, color, etc.
+
+            The list may be cached and returned again while the state is
+            unchanged, so callers must not mutate it.
         """
         pass
 
@@ -111,11 +140,14 @@ class PhysicsEngine(ABC):
             List of dicts with full physics info:
                 - id, type, mass, position, velocity, speed
                 - acceleration, forces, etc.
+
+            The list may be cached and returned again while the state is
+            unchanged, so callers must not mutate it.
         """
         pass
 
     @abstractmethod
-    def get_entity_for_editing(self, entity_id: str) -> Entity | None:
+    def get_entity_for_editing(self, entity_id: int) -> Entity | None:
         """Create temporary entity object for editing.
 
         Returns entity object populated from array data.
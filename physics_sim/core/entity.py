@@ -1,14 +1,49 @@
-from abc import ABC, abstractmethod
+import itertools
 from typing import Any
 
 import numpy as np
 
+from ._dtypes import STATE_DTYPE
 
-class Entity(ABC):
+# Shared default for thrust_vector; read-only so callers cannot mutate it
+_ZERO_VECTOR = np.zeros(2, dtype=STATE_DTYPE)
+_ZERO_VECTOR.flags.writeable = False
+
+# Number of force applications kept by PhysicalEntity.track_force
+MAX_TRACKED_FORCES = 8
+
+# Interned force names shared by all entities; tracked forces store the
+# int8 index into this table instead of the string
+_FORCE_NAMES: list[str] = []
+_FORCE_IDS: dict[str, int] = {}
+
+
+def _force_name_id(force_name: str) -> int:
+    force_id = _FORCE_IDS.get(force_name)
+    if force_id is None:
+        if len(_FORCE_NAMES) > np.iinfo(np.int8).max:
+            raise ValueError("Too many distinct force names to track")
+        force_id = len(_FORCE_NAMES)
+        _FORCE_NAMES.append(force_name)
+        _FORCE_IDS[force_name] = force_id
+    return force_id
+
+
+class Entity:
     """Base class for all simulation entities."""
 
-    def __init__(self, entity_id: str | None = None):
-        self.id = (entity_id or id(self).__str__())[:8]
+    # Entities are created per simulated object; subclasses declare their
+    # own __slots__ so instances carry no per-object __dict__
+    __slots__ = ("id",)
+
+    # Process-wide id source; starts at 1 so every generated id is truthy.
+    # Ids are plain ints so engines can keep them in integer arrays.
+    _next_id = itertools.count(1)
+
+    def __init__(self, entity_id: int | None = None):
+        self.id: int = (
+            int(entity_id) if entity_id is not None else next(Entity._next_id)
+        )
 
     @classmethod
     def get_default_parameters(cls) -> dict[str, dict[str, Any]]:
@@ -23,34 +58,55 @@ class Entity(ABC):
 class PhysicalEntity(Entity):
     """Base class for entities with physical properties."""
 
+    __slots__ = (
+        "position",
+        "velocity",
+        "mass",
+        "_force_buf",
+        "_force_ids",
+        "_force_count",
+    )
+
     def __init__(
         self,
         position: np.ndarray,
         velocity: np.ndarray,
         mass: float = 1.0,
-        entity_id: str | None = None,
+        entity_id: int | None = None,
     ):
         super().__init__(entity_id)
         self.position = position
         self.velocity = velocity
 
         self.mass = mass
-        self._applied_forces: list[
-            tuple[str, np.ndarray]
-        ] = []  # (force_name, force_vector)
+        # Ring buffer of the most recent force applications; _force_count is
+        # the total since the last clear, so the write slot is count % size
+        self._force_buf = np.zeros((MAX_TRACKED_FORCES, 2), dtype=STATE_DTYPE)
+        self._force_ids = np.zeros(MAX_TRACKED_FORCES, dtype=np.int8)
+        self._force_count = 0
 
     @property
     def drag_coefficient(self) -> float:
         """Coefficient of drag for air resistance calculations.
 
         Subclasses should override this property to provide entity-specific drag coefficients.
+        Default is 0.0 (no drag).
         """
-        pass
+        return 0.0
 
     @property
-    def cross_sectional_area() -> float:
-        """Cross sectional area for drag fore calculation"""
-        pass
+    def drag_enabled(self) -> bool:
+        """Whether drag forces act on this entity at all."""
+        return self.drag_coefficient > 0.0
+
+    @property
+    def cross_sectional_area(self) -> float:
+        """Cross sectional area for drag force calculation.
+
+        Subclasses should override this property to provide entity-specific areas.
+        Default is 0.0 (no drag).
+        """
+        return 0.0
 
     @property
     def friction_coefficient(self) -> float:
@@ -78,22 +134,42 @@ class PhysicalEntity(Entity):
         the current thrust direction and magnitude.
         Default is zero vector (no thrust).
         """
-        return np.array([0.0, 0.0])
+        return _ZERO_VECTOR
 
     def track_force(self, force_name: str, force_vector: np.ndarray):
         """Record a force application for data collection.
 
+        Only the last MAX_TRACKED_FORCES applications are kept.
+
         Args:
             force_name: Name of the force (e.g., "Gravity", "Drag")
             force_vector: Force vector that was applied as np.ndarray
         """
-        self._applied_forces.append((force_name, force_vector))
+        slot = self._force_count % MAX_TRACKED_FORCES
+        self._force_buf[slot] = force_vector
+        self._force_ids[slot] = _force_name_id(force_name)
+        self._force_count += 1
 
     def clear_force_tracking(self):
         """Clear tracked forces (called each frame)."""
-        self._applied_forces.clear()
+        self._force_count = 0
+
+    def get_tracked_forces(self) -> list[tuple[str, np.ndarray]]:
+        """Get tracked force applications, oldest first.
+
+        Returns:
+            List of (force_name, force_vector) tuples
+        """
+        count = min(self._force_count, MAX_TRACKED_FORCES)
+        start = self._force_count - count
+        return [
+            (
+                _FORCE_NAMES[self._force_ids[i % MAX_TRACKED_FORCES]],
+                self._force_buf[i % MAX_TRACKED_FORCES].copy(),
+            )
+            for i in range(start, self._force_count)
+        ]
 
-    @abstractmethod
     def get_settable_parameters(self) -> dict[str, dict[str, Any]]:
         """Get metadata for all editable parameters.
 
@@ -109,9 +185,8 @@ class PhysicalEntity(Entity):
                 }
             }
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def update_physics_data(self, config: dict[str, Any]) -> bool:
         """Update entity parameters from config dict.
 
@@ -121,4 +196,4 @@ class PhysicalEntity(Entity):
         Returns:
             True if update successful, False otherwise
         """
-        pass
+        raise NotImplementedError
@@ -1,22 +1,62 @@
-from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Protocol, runtime_checkable
 
 import numpy as np
 
+from ._dtypes import ACCUM_DTYPE, STATE_DTYPE
 
-class Force(ABC):
-    """Abstract base class for forces in the simulation.
+# Shared default for constant_accel_value; read-only so callers cannot mutate it
+_ZERO_ACCEL = np.zeros(2, dtype=np.float64)
+_ZERO_ACCEL.flags.writeable = False
+
+
+def _sum_stable(values: np.ndarray) -> float:
+    """Sum of all elements, accumulated in double precision.
+
+    np.add.reduce uses pairwise summation, so the error stays small even for
+    large float32 inputs.
+    """
+    return float(np.add.reduce(values, axis=None, dtype=ACCUM_DTYPE))
+
+
+@runtime_checkable
+class ForceKernel(Protocol):
+    """Structural type for anything that can evaluate a batched force.
+
+    Lets compiled or external kernels stand in where only the force
+    evaluation is needed, without subclassing Force. Engines check it once
+    when a force is registered.
+    """
+
+    def apply_force(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        masses: np.ndarray,
+        entity_types: np.ndarray,
+        dt: float,
+        **kwargs,
+    ) -> np.ndarray: ...
+
+
+class Force:
+    """Base class for forces in the simulation.
 
     Forces can be global (apply to all entities) or entity-specific
     (apply only to entities with certain properties).
     """
 
+    # True if the force is the same acceleration for every entity, whatever
+    # its state or mass; engines may then skip apply_force and add
+    # constant_accel_value() directly
+    is_constant_accel: bool = False
+
     def __init__(self, name: str):
         """
         Args:
             name: Human-readable name for this force (e.g., "Gravity", "Drag")
         """
         self.name = name
+        self._out: np.ndarray = np.empty((0, 2), dtype=STATE_DTYPE)
 
     def apply_force(
         self,
@@ -44,13 +84,24 @@ class Force(ABC):
                 - 'entity_types', 'type_properties', 'dynamic_mask'
 
         Returns:
-            Force vectors for all entities, shape (n, 2)
+            Force vectors for all entities, shape (n, 2). May be a buffer the
+            force reuses on its next call, so callers copy what they keep.
         """
-        # Default implementation: fallback to per-entity (slow but correct)
-        n = len(positions)
-        forces = np.zeros((n, 2), dtype=np.float64)
-        # Note: This is a fallback. Subclasses should override for performance.
-        return forces
+        raise NotImplementedError
+
+    def _output_buffer(self, n: int) -> np.ndarray:
+        """Reusable (n, 2) output array, grown on demand and never shrunk."""
+        if self._out.shape[0] < n:
+            self._out = np.empty((n, 2), dtype=STATE_DTYPE)
+        return self._out[:n]
+
+    def constant_accel_value(self) -> np.ndarray:
+        """Acceleration applied to every entity when is_constant_accel is set.
+
+        Returns:
+            Acceleration vector, shape (2,)
+        """
+        return _ZERO_ACCEL
 
     def get_potential_energy_contribution(
         self,
@@ -60,6 +111,9 @@ class Force(ABC):
     ) -> float:
         """Calculate potential energy contribution from this force.
 
+        Sums potential_energy_per_entity in one reduction; conservative forces
+        override that method rather than this one.
+
         Args:
             positions: Position vectors, shape (n, 2)
             masses: Mass values, shape (n,)
@@ -68,7 +122,25 @@ class Force(ABC):
         Returns:
             Total potential energy contribution in Joules
         """
-        return 0.0
+        energies = self.potential_energy_per_entity(positions, masses)
+        if energies is None:
+            return 0.0
+        return _sum_stable(energies)
+
+    def potential_energy_per_entity(
+        self, positions: np.ndarray, masses: np.ndarray
+    ) -> np.ndarray | None:
+        """Potential energy of each entity in this force's field.
+
+        Args:
+            positions: Position vectors, shape (n, 2)
+            masses: Mass values, shape (n,)
+
+        Returns:
+            Energies in Joules, shape (n,), or None if the force has no
+            potential
+        """
+        return None
 
     def apply_constraints(
         self,
@@ -96,10 +168,9 @@ class Force(ABC):
         return None
 
     @classmethod
-    @abstractmethod
     def get_name(cls) -> str:
         """Get force name"""
-        pass
+        raise NotImplementedError
 
     @classmethod
     def is_unique(cls) -> bool:
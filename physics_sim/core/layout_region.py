@@ -1,44 +1,41 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 __all__: list[str] = ["LayoutRegion"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LayoutRegion:
-    """Defines a rectangular region in screen space."""
+    """Defines a rectangular region in screen space.
+
+    Regions are immutable, so the edge and center coordinates read by
+    per-frame UI code are computed once on construction.
+    """
 
     x: int
     y: int
     width: int
     height: int
 
-    @property
-    def right(self) -> int:
-        """Right edge X coordinate."""
-        return self.x + self.width
-
-    @property
-    def left(self) -> int:
-        return self.x
-
-    @property
-    def top(self) -> int:
-        """Top edge Y coordinate."""
-        return self.y + self.height
-
-    @property
-    def bottom(self) -> int:
-        return self.y
-
-    @property
-    def center_x(self) -> int:
-        """Center X coordinate."""
-        return self.x + self.width // 2
-
-    @property
-    def center_y(self) -> int:
-        """Center Y coordinate."""
-        return self.y + self.height // 2
+    # Left edge X coordinate
+    left: int = field(init=False, repr=False, compare=False)
+    # Right edge X coordinate
+    right: int = field(init=False, repr=False, compare=False)
+    # Top edge Y coordinate
+    top: int = field(init=False, repr=False, compare=False)
+    # Bottom edge Y coordinate
+    bottom: int = field(init=False, repr=False, compare=False)
+    # Center X coordinate
+    center_x: int = field(init=False, repr=False, compare=False)
+    # Center Y coordinate
+    center_y: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "left", self.x)
+        object.__setattr__(self, "right", self.x + self.width)
+        object.__setattr__(self, "top", self.y + self.height)
+        object.__setattr__(self, "bottom", self.y)
+        object.__setattr__(self, "center_x", self.x + self.width // 2)
+        object.__setattr__(self, "center_y", self.y + self.height // 2)
 
     def __str__(self) -> str:
         return f"L:{self.left} R:{self.right}; T:{self.top} B:{self.bottom}"
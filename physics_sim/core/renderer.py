@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from .entity import Entity
 
 
@@ -48,6 +50,30 @@ class Renderer(ABC):
         """Convert screen Y coordinate to physics coordinate."""
         pass
 
+    def physics_to_screen(self, points: np.ndarray) -> np.ndarray:
+        """Convert (n, 2) physics points to screen coordinates in one call.
+
+        The default applies the per-axis conversions to whole columns;
+        backends with an affine mapping can override it.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        return np.column_stack(
+            (
+                self.physics_to_screen_x(points[:, 0]),
+                self.physics_to_screen_y(points[:, 1]),
+            )
+        )
+
+    def screen_to_physics(self, points: np.ndarray) -> np.ndarray:
+        """Convert (n, 2) screen points to physics coordinates in one call."""
+        points = np.asarray(points, dtype=np.float64)
+        return np.column_stack(
+            (
+                self.screen_to_physics_x(points[:, 0]),
+                self.screen_to_physics_y(points[:, 1]),
+            )
+        )
+
     @abstractmethod
     def clear(self) -> None:
         """Clear the screen."""
@@ -0,0 +1,507 @@
+"""Numba kernels for the numpy engine's per-step hot loops.
+
+Each kernel works in place on raw (n, 2) state arrays. The mixins only call
+them when ``NUMBA_AVAILABLE`` is set and otherwise use their NumPy code.
+Signatures use ``f4`` to match the engine's float32 ``STATE_DTYPE`` arrays.
+
+The ``*_parallel`` variants spread the row loop over threads with ``prange``.
+Rows are independent, but thread start-up only pays off for large batches,
+so callers switch to them above ``PARALLEL_THRESHOLD`` rows.
+
+The collision kernels resolve contacts one pair at a time, each pair seeing
+the corrections made before it, so their pair loops are deliberately serial.
+"""
+
+import numpy as np
+
+from physics_sim.core._jit import njit, prange
+
+from .constants import CANDIDATE_MARGIN, EPS
+
+
+@njit("void(f4[:, :], f4[:, :], f4[:, :], f4)", cache=True, fastmath=True)
+def integrate_euler(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    accelerations: np.ndarray,
+    dt: float,
+) -> None:
+    # Semi-implicit Euler in a single pass over the rows
+    for i in range(positions.shape[0]):
+        vx = velocities[i, 0] + accelerations[i, 0] * dt
+        vy = velocities[i, 1] + accelerations[i, 1] * dt
+        velocities[i, 0] = vx
+        velocities[i, 1] = vy
+        positions[i, 0] += vx * dt
+        positions[i, 1] += vy * dt
+
+
+@njit("void(f4[:, :], f4[:, :], f4[:], f4, f4)", cache=True, fastmath=True)
+def accumulate_accelerations(
+    accelerations: np.ndarray,
+    net_force: np.ndarray,
+    inv_masses: np.ndarray,
+    ax: float,
+    ay: float,
+) -> None:
+    # a += F * (1 / m) + a_const, fused into one pass over the rows
+    for i in range(accelerations.shape[0]):
+        accelerations[i, 0] += net_force[i, 0] * inv_masses[i] + ax
+        accelerations[i, 1] += net_force[i, 1] * inv_masses[i] + ay
+
+
+@njit(
+    "void(f4[:, :], f4[:, :], f4[:, :], f4)", cache=True, fastmath=True, parallel=True
+)
+def integrate_euler_parallel(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    accelerations: np.ndarray,
+    dt: float,
+) -> None:
+    for i in prange(positions.shape[0]):
+        vx = velocities[i, 0] + accelerations[i, 0] * dt
+        vy = velocities[i, 1] + accelerations[i, 1] * dt
+        velocities[i, 0] = vx
+        velocities[i, 1] = vy
+        positions[i, 0] += vx * dt
+        positions[i, 1] += vy * dt
+
+
+@njit(
+    "void(f4[:, :], f4[:, :], f4[:], f4, f4)", cache=True, fastmath=True, parallel=True
+)
+def accumulate_accelerations_parallel(
+    accelerations: np.ndarray,
+    net_force: np.ndarray,
+    inv_masses: np.ndarray,
+    ax: float,
+    ay: float,
+) -> None:
+    for i in prange(accelerations.shape[0]):
+        accelerations[i, 0] += net_force[i, 0] * inv_masses[i] + ax
+        accelerations[i, 1] += net_force[i, 1] * inv_masses[i] + ay
+
+
+@njit("void(f4[:, :], f4[:, :], f4[:], f4[:], f4, f4)", cache=True, fastmath=True)
+def boundary_collisions(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    radii: np.ndarray,
+    restitutions: np.ndarray,
+    width: float,
+    height: float,
+) -> None:
+    # Clamp each ball inside [r, bound - r] and reflect the velocity
+    # component of every axis that was clamped
+    for i in range(positions.shape[0]):
+        r = radii[i]
+        x = min(max(positions[i, 0], r), width - r)
+        if x != positions[i, 0]:
+            positions[i, 0] = x
+            velocities[i, 0] *= -restitutions[i]
+        y = min(max(positions[i, 1], r), height - r)
+        if y != positions[i, 1]:
+            positions[i, 1] = y
+            velocities[i, 1] *= -restitutions[i]
+
+
+@njit(cache=True, fastmath=True)
+def _collide_ball_pair(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    inv_masses: np.ndarray,
+    radii: np.ndarray,
+    restitutions: np.ndarray,
+    friction_coeffs: np.ndarray,
+    friction_enabled: bool,
+    i: int,
+    j: int,
+) -> bool:
+    # Exact overlap test and impulse response for one ball pair, in place.
+    # Returns whether the positional correction moved the two balls.
+    dx = positions[j, 0] - positions[i, 0]
+    dy = positions[j, 1] - positions[i, 1]
+    dist_sq = dx * dx + dy * dy
+    min_distance = radii[i] + radii[j]
+    if dist_sq >= min_distance * min_distance or dist_sq <= EPS * EPS:
+        return False
+    distance = np.sqrt(dist_sq)
+    nx = dx / distance
+    ny = dy / distance
+    v_normal = (velocities[i, 0] - velocities[j, 0]) * nx + (
+        velocities[i, 1] - velocities[j, 1]
+    ) * ny
+    if v_normal <= 0.0:
+        return False
+
+    inv_mass_i = inv_masses[i]
+    inv_mass_j = inv_masses[j]
+    inv_mass_sum = inv_mass_i + inv_mass_j
+    restitution = (restitutions[i] + restitutions[j]) / 2.0
+    impulse = (-(1.0 + restitution) * v_normal) / inv_mass_sum
+    velocities[i, 0] += impulse * nx * inv_mass_i
+    velocities[i, 1] += impulse * ny * inv_mass_i
+    velocities[j, 0] -= impulse * nx * inv_mass_j
+    velocities[j, 1] -= impulse * ny * inv_mass_j
+
+    # Split the overlap in proportion to inverse mass: m_j / (m_i + m_j)
+    # equals inv_mass_i / (inv_mass_i + inv_mass_j)
+    correction = (min_distance - distance) / inv_mass_sum
+    share_i = correction * inv_mass_i
+    share_j = correction * inv_mass_j
+    positions[i, 0] -= nx * share_i
+    positions[i, 1] -= ny * share_i
+    positions[j, 0] += nx * share_j
+    positions[j, 1] += ny * share_j
+
+    if friction_enabled:
+        rvx = velocities[i, 0] - velocities[j, 0]
+        rvy = velocities[i, 1] - velocities[j, 1]
+        rv_normal = rvx * nx + rvy * ny
+        tx = rvx - rv_normal * nx
+        ty = rvy - rv_normal * ny
+        tangential_speed = np.sqrt(tx * tx + ty * ty)
+        if tangential_speed > EPS:
+            friction_coeff = (friction_coeffs[i] + friction_coeffs[j]) / 2.0
+            scale = friction_coeff * abs(impulse) / tangential_speed
+            velocities[i, 0] -= scale * tx * inv_mass_i
+            velocities[i, 1] -= scale * ty * inv_mass_i
+            velocities[j, 0] += scale * tx * inv_mass_j
+            velocities[j, 1] += scale * ty * inv_mass_j
+    return True
+
+
+@njit(
+    "void(f4[:, :], f4[:, :], f4[:], f4[:], f4[:], f4[:], b1)",
+    cache=True,
+    fastmath=True,
+)
+def ball_ball_collisions(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    inv_masses: np.ndarray,
+    radii: np.ndarray,
+    restitutions: np.ndarray,
+    friction_coeffs: np.ndarray,
+    friction_enabled: bool,
+) -> None:
+    # Sequential impulses over every pair, in place. Later pairs see the
+    # corrections of earlier ones, so the loop stays serial.
+    n = positions.shape[0]
+    for i in range(n):
+        for j in range(i + 1, n):
+            # Cheap rejection inline; most pairs are far apart
+            dx = positions[j, 0] - positions[i, 0]
+            dy = positions[j, 1] - positions[i, 1]
+            reach = radii[i] + radii[j]
+            if dx * dx + dy * dy >= reach * reach:
+                continue
+            _collide_ball_pair(
+                positions,
+                velocities,
+                inv_masses,
+                radii,
+                restitutions,
+                friction_coeffs,
+                friction_enabled,
+                i,
+                j,
+            )
+
+
+@njit(cache=True)
+def _grid_bucket(cell_x: int, cell_y: int, mask: int) -> int:
+    # Spatial hash of a grid cell; distinct cells may share a bucket
+    return ((cell_x * 73856093) ^ (cell_y * 19349663)) & mask
+
+
+@njit(cache=True)
+def _grid_file(
+    j: int,
+    positions: np.ndarray,
+    inv_cell_size: float,
+    cells: np.ndarray,
+    heads: np.ndarray,
+    next_row: np.ndarray,
+    prev_row: np.ndarray,
+    mask: int,
+    linked: bool,
+) -> None:
+    # File ball j under the cell of its current position. Buckets are
+    # doubly linked lists of rows, so a ball that changes cell is unlinked
+    # in constant time.
+    cell_x = np.int64(np.floor(positions[j, 0] * inv_cell_size))
+    cell_y = np.int64(np.floor(positions[j, 1] * inv_cell_size))
+    if linked:
+        if cell_x == cells[j, 0] and cell_y == cells[j, 1]:
+            return
+        if prev_row[j] >= 0:
+            next_row[prev_row[j]] = next_row[j]
+        else:
+            heads[_grid_bucket(cells[j, 0], cells[j, 1], mask)] = next_row[j]
+        if next_row[j] >= 0:
+            prev_row[next_row[j]] = prev_row[j]
+    cells[j, 0] = cell_x
+    cells[j, 1] = cell_y
+    bucket = _grid_bucket(cell_x, cell_y, mask)
+    prev_row[j] = -1
+    next_row[j] = heads[bucket]
+    if heads[bucket] >= 0:
+        prev_row[heads[bucket]] = j
+    heads[bucket] = j
+
+
+@njit(cache=True)
+def _grid_candidates(
+    i: int,
+    after: int,
+    cells: np.ndarray,
+    heads: np.ndarray,
+    next_row: np.ndarray,
+    mask: int,
+    candidates: np.ndarray,
+) -> int:
+    # Rows j > after filed in the 3x3 cells around ball i, written to
+    # candidates in ascending order; returns how many were found
+    count = 0
+    for offset_x in range(-1, 2):
+        for offset_y in range(-1, 2):
+            cell_x = cells[i, 0] + offset_x
+            cell_y = cells[i, 1] + offset_y
+            j = heads[_grid_bucket(cell_x, cell_y, mask)]
+            while j >= 0:
+                # A shared bucket also holds rows of other cells
+                if j > after and cells[j, 0] == cell_x and cells[j, 1] == cell_y:
+                    # Insertion keeps the handful of candidates sorted
+                    # without a sort call per ball
+                    slot = count
+                    while slot > 0 and candidates[slot - 1] > j:
+                        candidates[slot] = candidates[slot - 1]
+                        slot -= 1
+                    candidates[slot] = j
+                    count += 1
+                j = next_row[j]
+    return count
+
+
+@njit(
+    "void(f4[:, :], f4[:, :], f4[:], f4[:], f4[:], f4[:], b1)",
+    cache=True,
+    fastmath=True,
+)
+def ball_ball_grid_collisions(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    inv_masses: np.ndarray,
+    radii: np.ndarray,
+    restitutions: np.ndarray,
+    friction_coeffs: np.ndarray,
+    friction_enabled: bool,
+) -> None:
+    # Same contacts and order as ball_ball_collisions, with each ball only
+    # tested against balls in its own and the adjacent cells of a uniform
+    # grid of side 2 * max radius. The grid follows the balls: a correction
+    # re-files both balls under their new cells and gathers ball i's
+    # remaining candidates again, so a pair pushed into contact by an
+    # earlier correction is still found.
+    n = positions.shape[0]
+    if n < 2:
+        return
+    cell_size = 2.0 * radii.max() * CANDIDATE_MARGIN
+    if cell_size <= 0.0:
+        return
+
+    inv_cell_size = 1.0 / cell_size
+    table_size = 1
+    while table_size < 2 * n:
+        table_size <<= 1
+    mask = table_size - 1
+    heads = np.full(table_size, -1, dtype=np.int64)
+    next_row = np.empty(n, dtype=np.int64)
+    prev_row = np.empty(n, dtype=np.int64)
+    cells = np.empty((n, 2), dtype=np.int64)
+    for j in range(n):
+        _grid_file(
+            j,
+            positions,
+            inv_cell_size,
+            cells,
+            heads,
+            next_row,
+            prev_row,
+            mask,
+            False,
+        )
+
+    candidates = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        count = _grid_candidates(i, i, cells, heads, next_row, mask, candidates)
+        k = 0
+        while k < count:
+            j = candidates[k]
+            k += 1
+            dx = positions[j, 0] - positions[i, 0]
+            dy = positions[j, 1] - positions[i, 1]
+            reach = radii[i] + radii[j]
+            if dx * dx + dy * dy >= reach * reach:
+                continue
+            moved = _collide_ball_pair(
+                positions,
+                velocities,
+                inv_masses,
+                radii,
+                restitutions,
+                friction_coeffs,
+                friction_enabled,
+                i,
+                j,
+            )
+            if moved:
+                for row in (i, j):
+                    _grid_file(
+                        row,
+                        positions,
+                        inv_cell_size,
+                        cells,
+                        heads,
+                        next_row,
+                        prev_row,
+                        mask,
+                        True,
+                    )
+                count = _grid_candidates(i, j, cells, heads, next_row, mask, candidates)
+                k = 0
+
+
+@njit(cache=True, fastmath=True)
+def _bounce_off_static(
+    velocities: np.ndarray,
+    positions: np.ndarray,
+    i: int,
+    nx: float,
+    ny: float,
+    overlap: float,
+    restitution: float,
+    friction_coeff: float,
+    friction_enabled: bool,
+) -> None:
+    # Shared response of ball i against an immovable surface with normal n
+    v_normal = velocities[i, 0] * nx + velocities[i, 1] * ny
+    if v_normal >= 0.0:
+        return
+    # Normal velocity change, reused as the friction bound below
+    bounce = (1.0 + restitution) * v_normal
+    velocities[i, 0] -= bounce * nx
+    velocities[i, 1] -= bounce * ny
+    if overlap > 0.0:
+        positions[i, 0] += nx * overlap
+        positions[i, 1] += ny * overlap
+
+    if friction_enabled:
+        vn = velocities[i, 0] * nx + velocities[i, 1] * ny
+        tx = velocities[i, 0] - vn * nx
+        ty = velocities[i, 1] - vn * ny
+        tangential_speed = np.sqrt(tx * tx + ty * ty)
+        if tangential_speed > EPS:
+            scale = friction_coeff * abs(bounce) / tangential_speed
+            velocities[i, 0] -= scale * tx
+            velocities[i, 1] -= scale * ty
+
+
+@njit(
+    "void(f4[:, :], f4[:, :], f4[:], f4[:], f4[:], f4[:, :], f4[:], f4[:], b1)",
+    cache=True,
+    fastmath=True,
+)
+def ball_circle_collisions(
+    ball_positions: np.ndarray,
+    ball_velocities: np.ndarray,
+    ball_radii: np.ndarray,
+    ball_restitutions: np.ndarray,
+    ball_friction: np.ndarray,
+    circle_positions: np.ndarray,
+    circle_radii: np.ndarray,
+    circle_friction: np.ndarray,
+    friction_enabled: bool,
+) -> None:
+    for i in range(ball_positions.shape[0]):
+        for j in range(circle_positions.shape[0]):
+            dx = ball_positions[i, 0] - circle_positions[j, 0]
+            dy = ball_positions[i, 1] - circle_positions[j, 1]
+            dist_sq = dx * dx + dy * dy
+            min_distance = ball_radii[i] + circle_radii[j]
+            if dist_sq >= min_distance * min_distance or dist_sq <= EPS * EPS:
+                continue
+            distance = np.sqrt(dist_sq)
+            _bounce_off_static(
+                ball_velocities,
+                ball_positions,
+                i,
+                dx / distance,
+                dy / distance,
+                min_distance - distance,
+                ball_restitutions[i],
+                (ball_friction[i] + circle_friction[j]) / 2.0,
+                friction_enabled,
+            )
+
+
+@njit(
+    "void(f4[:, :], f4[:, :], f4[:], f4[:], f4[:], f4[:, :], f4[:], f4[:], f4[:], b1)",
+    cache=True,
+    fastmath=True,
+)
+def ball_rectangle_collisions(
+    ball_positions: np.ndarray,
+    ball_velocities: np.ndarray,
+    ball_radii: np.ndarray,
+    ball_restitutions: np.ndarray,
+    ball_friction: np.ndarray,
+    rect_positions: np.ndarray,
+    half_widths: np.ndarray,
+    half_heights: np.ndarray,
+    rect_friction: np.ndarray,
+    friction_enabled: bool,
+) -> None:
+    for i in range(ball_positions.shape[0]):
+        for j in range(rect_positions.shape[0]):
+            left = rect_positions[j, 0] - half_widths[j]
+            right = rect_positions[j, 0] + half_widths[j]
+            bottom = rect_positions[j, 1] - half_heights[j]
+            top = rect_positions[j, 1] + half_heights[j]
+            ball_x = ball_positions[i, 0]
+            ball_y = ball_positions[i, 1]
+
+            dx = ball_x - min(max(ball_x, left), right)
+            dy = ball_y - min(max(ball_y, bottom), top)
+            distance = np.sqrt(dx * dx + dy * dy)
+            radius = ball_radii[i]
+            if distance >= radius:
+                continue
+            if distance < EPS:
+                # Centre inside: leave through the nearest edge, first of
+                # left, right, bottom, top on ties
+                nx, ny, edge_distance = -1.0, 0.0, abs(ball_x - left)
+                if abs(ball_x - right) < edge_distance:
+                    nx, ny, edge_distance = 1.0, 0.0, abs(ball_x - right)
+                if abs(ball_y - bottom) < edge_distance:
+                    nx, ny, edge_distance = 0.0, -1.0, abs(ball_y - bottom)
+                if abs(ball_y - top) < edge_distance:
+                    nx, ny, edge_distance = 0.0, 1.0, abs(ball_y - top)
+                overlap = radius + edge_distance
+            else:
+                nx = dx / distance
+                ny = dy / distance
+                overlap = radius - distance
+            _bounce_off_static(
+                ball_velocities,
+                ball_positions,
+                i,
+                nx,
+                ny,
+                overlap,
+                ball_restitutions[i],
+                (ball_friction[i] + rect_friction[j]) / 2.0,
+                friction_enabled,
+            )
@@ -1,47 +1,39 @@
 import numpy as np
+
+from physics_sim.core._jit import NUMBA_AVAILABLE
+
+from . import _kernels
 from .types import EntityType
 
 
 class BoundaryMixin:
     def _handle_boundary_collisions_vectorized(self) -> None:
         width, height = self.bounds
-        n = self._n_entities
-
-        ball_mask = self._dynamic_mask[:n] & (self._entity_types[:n] == EntityType.BALL)
-        ball_indices = np.where(ball_mask)[0]
-        if len(ball_indices) == 0:
+        start, end = self._block_range(EntityType.BALL)
+        if start == end:
             return
 
-        radii = self._type_properties[EntityType.BALL]["radius"][ball_indices]
-
-        left_collision = self._positions[ball_indices, 0] - radii < 0
-        if left_collision.any():
-            self._positions[ball_indices[left_collision], 0] = radii[left_collision]
-            self._velocities[ball_indices[left_collision], 0] *= -self._restitutions[
-                ball_indices[left_collision]
-            ]
+        # Views of the ball block, updated in place
+        positions = self._positions[start:end]
+        velocities = self._velocities[start:end]
+        radii = self._ball_radius[start:end]
+        restitutions = self._restitutions[start:end]
 
-        right_collision = self._positions[ball_indices, 0] + radii > width
-        if right_collision.any():
-            self._positions[ball_indices[right_collision], 0] = (
-                width - radii[right_collision]
+        if NUMBA_AVAILABLE:
+            _kernels.boundary_collisions(
+                positions, velocities, radii, restitutions, width, height
             )
-            self._velocities[ball_indices[right_collision], 0] *= -self._restitutions[
-                ball_indices[right_collision]
-            ]
-
-        bottom_collision = self._positions[ball_indices, 1] - radii < 0
-        if bottom_collision.any():
-            self._positions[ball_indices[bottom_collision], 1] = radii[bottom_collision]
-            self._velocities[ball_indices[bottom_collision], 1] *= -self._restitutions[
-                ball_indices[bottom_collision]
-            ]
+            return
 
-        top_collision = self._positions[ball_indices, 1] + radii > height
-        if top_collision.any():
-            self._positions[ball_indices[top_collision], 1] = (
-                height - radii[top_collision]
-            )
-            self._velocities[ball_indices[top_collision], 1] *= -self._restitutions[
-                ball_indices[top_collision]
-            ]
+        # One clamp per axis instead of four masked passes: whatever the
+        # clamp moved hit a wall, and its velocity component is reflected.
+        # maximum/minimum with out= skip np.clip's dispatch overhead and
+        # reuse a single temporary per axis.
+        reflect = -restitutions
+        for axis, bound in ((0, width), (1, height)):
+            coords = positions[:, axis]
+            clamped = np.maximum(coords, radii)
+            np.minimum(clamped, bound - radii, out=clamped)
+            hit = clamped != coords
+            coords[:] = clamped
+            velocities[:, axis] *= np.where(hit, reflect, 1.0)
@@ -1,229 +1,539 @@
+import heapq
+import math
+
 import numpy as np
+
+from physics_sim.core._jit import NUMBA_AVAILABLE
+
+from . import _kernels
+from ._broadphase import grid_candidate_pairs
+from .constants import (
+    CANDIDATE_MARGIN,
+    EPS,
+    GRID_BROADPHASE_THRESHOLD,
+    GRID_BROADPHASE_THRESHOLD_NUMBA,
+)
 from .types import EntityType
-from .constants import EPS
+
+# Outward normals of the left, right, bottom and top rectangle edges
+_EDGE_NORMALS = [(-1.0, 0.0), (1.0, 0.0), (0.0, -1.0), (0.0, 1.0)]
 
 
 class CollisionMixin:
     def _handle_ball_ball_collisions_vectorized(self) -> None:
-        n = self._n_entities
-        ball_mask = self._dynamic_mask[:n] & (self._entity_types[:n] == EntityType.BALL)
-        ball_indices = np.where(ball_mask)[0]
-        if len(ball_indices) < 2:
+        # Balls occupy one contiguous block, so these are views that the
+        # kernels and resolvers update in place
+        start, end = self._block_range(EntityType.BALL)
+        n_balls = end - start
+        if n_balls < 2:
+            return
+
+        positions = self._positions[start:end]
+        velocities = self._velocities[start:end]
+        inv_masses = self._inv_masses[start:end]
+        radii = self._ball_radius[start:end]
+        restitutions = self._restitutions[start:end]
+        friction_coeffs = self._friction_coeffs[start:end]
+
+        if NUMBA_AVAILABLE:
+            kernel = (
+                _kernels.ball_ball_grid_collisions
+                if n_balls >= GRID_BROADPHASE_THRESHOLD_NUMBA
+                else _kernels.ball_ball_collisions
+            )
+            kernel(
+                positions,
+                velocities,
+                inv_masses,
+                radii,
+                restitutions,
+                friction_coeffs,
+                self.friction_enabled,
+            )
+            return
+
+        if n_balls >= GRID_BROADPHASE_THRESHOLD:
+            # Only balls in the same or adjacent grid cells are tested
+            pairs_i, pairs_j = grid_candidate_pairs(positions, radii)
+        else:
+            # Overlap test over all pairs at once: delta[i, j] = p_j - p_i.
+            # Only candidate pairs, in (i, j) row-major order, reach the
+            # resolver, which repeats the exact test; the margin keeps
+            # rounding in the squared distances from dropping a pair that
+            # test would accept.
+            deltas = positions[np.newaxis, :, :] - positions[:, np.newaxis, :]
+            dist_sq = np.einsum("ijk,ijk->ij", deltas, deltas)
+            reach = (radii[:, np.newaxis] + radii[np.newaxis, :]) * CANDIDATE_MARGIN
+            hits = np.triu(dist_sq < reach * reach, k=1)
+            pairs_i, pairs_j = np.nonzero(hits)
+        if len(pairs_i) == 0:
             return
 
-        positions = self._positions[ball_indices]
-        velocities = self._velocities[ball_indices]
-        masses = self._masses[ball_indices]
-        radii = self._type_properties[EntityType.BALL]["radius"][ball_indices]
-        restitutions = self._restitutions[ball_indices]
-
-        n_balls = len(ball_indices)
-        for i in range(n_balls):
-            for j in range(i + 1, n_balls):
-                delta = positions[j] - positions[i]
-                distance = np.linalg.norm(delta)
-                min_distance = radii[i] + radii[j]
-                if distance < min_distance and distance > EPS:
-                    normal = delta / distance
-                    relative_velocity = velocities[i] - velocities[j]
-                    v_normal = np.dot(relative_velocity, normal)
-                    if v_normal <= 0:
-                        continue
-
-                    restitution = (restitutions[i] + restitutions[j]) / 2.0
-                    impulse_scalar = (-(1.0 + restitution) * v_normal) / (
-                        1.0 / masses[i] + 1.0 / masses[j]
-                    )
-                    impulse = impulse_scalar * normal
-                    velocities[i] += impulse / masses[i]
-                    velocities[j] -= impulse / masses[j]
-
-                    overlap = min_distance - distance
-                    if overlap > 0:
-                        total_mass = masses[i] + masses[j]
-                        positions[i] -= normal * overlap * (masses[j] / total_mass)
-                        positions[j] += normal * overlap * (masses[i] / total_mass)
-
-                    if self.friction_enabled:
-                        relative_velocity = velocities[i] - velocities[j]
-                        v_normal_component = np.dot(relative_velocity, normal) * normal
-                        tangential_velocity = relative_velocity - v_normal_component
-                        tangential_speed = np.linalg.norm(tangential_velocity)
-                        if tangential_speed > EPS:
-                            tangent = tangential_velocity / tangential_speed
-                            friction_coeff = (
-                                self._friction_coeffs[ball_indices[i]]
-                                + self._friction_coeffs[ball_indices[j]]
-                            ) / 2.0
-                            friction_scalar = friction_coeff * abs(impulse_scalar)
-                            friction_impulse = friction_scalar * tangent
-                            velocities[i] -= friction_impulse / masses[i]
-                            velocities[j] += friction_impulse / masses[j]
-
-        self._positions[ball_indices] = positions
-        self._velocities[ball_indices] = velocities
+        self._resolve_ball_ball_pairs(
+            pairs_i.tolist(),
+            pairs_j.tolist(),
+            positions,
+            velocities,
+            inv_masses,
+            radii,
+            restitutions,
+            friction_coeffs,
+        )
+
+    def _resolve_ball_ball_pairs(
+        self,
+        pairs_i: list[int],
+        pairs_j: list[int],
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        inv_masses: np.ndarray,
+        radii: np.ndarray,
+        restitutions: np.ndarray,
+        friction_coeffs: np.ndarray,
+    ) -> None:
+        # Same contacts, in the same (i, j) row-major order, as the full pair
+        # loop of _kernels.ball_ball_collisions: each pair sees the
+        # corrections of the pairs before it, so the exact test is repeated
+        # on current positions. The candidates were found before any
+        # correction, and a correction can push a ball into one it was not a
+        # candidate of. Every ball a correction moves is therefore looked up
+        # again in a uniform grid of side 2 * max radius that follows the
+        # balls, and each new neighbour becomes a candidate of the lower row
+        # of the pair, unless the loop is already past that row.
+        pos = positions.tolist()
+        vel = velocities.tolist()
+        inv_mass = inv_masses.tolist()
+        radius = radii.tolist()
+        restitution = restitutions.tolist()
+        friction = friction_coeffs.tolist()
+
+        candidates: dict[int, list[int]] = {}
+        for i, j in zip(pairs_i, pairs_j):
+            candidates.setdefault(i, []).append(j)
+        # Rows still to visit; ascending, so already a valid heap
+        rows = list(candidates)
+        # Rows whose candidates were extended, and may be out of order
+        extended: set[int] = set()
+
+        inv_cell_size = 1.0 / (2.0 * max(radius) * CANDIDATE_MARGIN)
+        # Built on the first correction, as most steps have none
+        cells: dict[tuple[int, int], list[int]] = {}
+        cell_of: list[tuple[int, int]] = []
+
+        def refile(row: int) -> None:
+            x, y = pos[row]
+            cell = (math.floor(x * inv_cell_size), math.floor(y * inv_cell_size))
+            if cell != cell_of[row]:
+                cells[cell_of[row]].remove(row)
+                cells.setdefault(cell, []).append(row)
+                cell_of[row] = cell
+
+        def neighbours(row: int, after: int) -> list[int]:
+            # Rows past after within reach of ball row, from the 3x3 cells
+            # around it
+            x, y = pos[row]
+            radius_row = radius[row]
+            cell_x, cell_y = cell_of[row]
+            found = []
+            for near_x in (cell_x - 1, cell_x, cell_x + 1):
+                for near_y in (cell_y - 1, cell_y, cell_y + 1):
+                    for other in cells.get((near_x, near_y), ()):
+                        if other <= after or other == row:
+                            continue
+                        dx = pos[other][0] - x
+                        dy = pos[other][1] - y
+                        reach = (radius_row + radius[other]) * CANDIDATE_MARGIN
+                        if dx * dx + dy * dy < reach * reach:
+                            found.append(other)
+            return found
+
+        visited = -1
+        while rows:
+            i = heapq.heappop(rows)
+            if i == visited:
+                continue
+            visited = i
+            pending = candidates.pop(i)
+            if i in extended:
+                pending = sorted(set(pending))
+            pos_i = pos[i]
+            radius_i = radius[i]
+            k = 0
+            while k < len(pending):
+                j = pending[k]
+                k += 1
+                # Far pairs are rejected before the call overhead
+                dx = pos[j][0] - pos_i[0]
+                dy = pos[j][1] - pos_i[1]
+                reach = radius_i + radius[j]
+                if dx * dx + dy * dy >= reach * reach:
+                    continue
+                if not self._collide_ball_pair(
+                    pos, vel, inv_mass, radius, restitution, friction, i, j
+                ):
+                    continue
+                if not cell_of:
+                    scaled = np.floor(positions * inv_cell_size).astype(np.int64)
+                    cell_of.extend(map(tuple, scaled.tolist()))
+                    for row, cell in enumerate(cell_of):
+                        cells.setdefault(cell, []).append(row)
+                refile(i)
+                refile(j)
+                # New candidates of ball i, after j, go straight into its
+                # pending rows; those of later rows wait for their visit
+                found = neighbours(i, j)
+                for other in neighbours(j, i):
+                    low, high = (other, j) if other < j else (j, other)
+                    candidates.setdefault(low, []).append(high)
+                    extended.add(low)
+                    heapq.heappush(rows, low)
+                if found:
+                    pending = sorted(set(pending[k:]).union(found))
+                    k = 0
+
+        positions[:] = pos
+        velocities[:] = vel
+
+    def _collide_ball_pair(
+        self,
+        pos: list[list[float]],
+        vel: list[list[float]],
+        inv_mass: list[float],
+        radius: list[float],
+        restitution: list[float],
+        friction: list[float],
+        i: int,
+        j: int,
+    ) -> bool:
+        # Exact overlap test and impulse response for one pair of balls held
+        # as [x, y] lists. Plain floats and math.sqrt avoid NumPy's per-call
+        # overhead on the 2-vectors. Returns whether the positional
+        # correction moved the two balls.
+        pos_i, pos_j = pos[i], pos[j]
+        dx = pos_j[0] - pos_i[0]
+        dy = pos_j[1] - pos_i[1]
+        dist_sq = dx * dx + dy * dy
+        min_distance = radius[i] + radius[j]
+        if dist_sq >= min_distance * min_distance or dist_sq <= EPS * EPS:
+            return False
+        distance = math.sqrt(dist_sq)
+        nx = dx / distance
+        ny = dy / distance
+        vel_i, vel_j = vel[i], vel[j]
+        v_normal = (vel_i[0] - vel_j[0]) * nx + (vel_i[1] - vel_j[1]) * ny
+        if v_normal <= 0:
+            return False
+
+        inv_mass_i = inv_mass[i]
+        inv_mass_j = inv_mass[j]
+        inv_mass_sum = inv_mass_i + inv_mass_j
+        pair_restitution = (restitution[i] + restitution[j]) / 2.0
+        impulse = (-(1.0 + pair_restitution) * v_normal) / inv_mass_sum
+        vel_i[0] += impulse * nx * inv_mass_i
+        vel_i[1] += impulse * ny * inv_mass_i
+        vel_j[0] -= impulse * nx * inv_mass_j
+        vel_j[1] -= impulse * ny * inv_mass_j
+
+        # Overlap split in inverse-mass proportion, as in the kernel
+        correction = (min_distance - distance) / inv_mass_sum
+        share_i = correction * inv_mass_i
+        share_j = correction * inv_mass_j
+        pos_i[0] -= nx * share_i
+        pos_i[1] -= ny * share_i
+        pos_j[0] += nx * share_j
+        pos_j[1] += ny * share_j
+
+        if self.friction_enabled:
+            rvx = vel_i[0] - vel_j[0]
+            rvy = vel_i[1] - vel_j[1]
+            rv_normal = rvx * nx + rvy * ny
+            tx = rvx - rv_normal * nx
+            ty = rvy - rv_normal * ny
+            tangential_speed = math.sqrt(tx * tx + ty * ty)
+            if tangential_speed > EPS:
+                friction_coeff = (friction[i] + friction[j]) / 2.0
+                scale = friction_coeff * abs(impulse) / tangential_speed
+                vel_i[0] -= scale * tx * inv_mass_i
+                vel_i[1] -= scale * ty * inv_mass_i
+                vel_j[0] += scale * tx * inv_mass_j
+                vel_j[1] += scale * ty * inv_mass_j
+        return True
 
     def _handle_ball_obstacle_collisions_vectorized(self) -> None:
         self._handle_ball_circle_obstacle_collisions_vectorized()
         self._handle_ball_rectangle_obstacle_collisions_vectorized()
 
     def _handle_ball_circle_obstacle_collisions_vectorized(self) -> None:
-        n = self._n_entities
-        ball_mask = self._dynamic_mask[:n] & (self._entity_types[:n] == EntityType.BALL)
-        circle_mask = self._is_static[:n] & (
-            self._entity_types[:n] == EntityType.CIRCLE_OBSTACLE
+        ball_start, ball_end = self._block_range(EntityType.BALL)
+        circle_start, circle_end = self._block_range(EntityType.CIRCLE_OBSTACLE)
+        if ball_start == ball_end or circle_start == circle_end:
+            return
+
+        ball_positions = self._positions[ball_start:ball_end]
+        ball_velocities = self._velocities[ball_start:ball_end]
+        ball_radii = self._ball_radius[ball_start:ball_end]
+        ball_restitutions = self._restitutions[ball_start:ball_end]
+        ball_friction = self._friction_coeffs[ball_start:ball_end]
+
+        circle_positions = self._positions[circle_start:circle_end]
+        circle_radii = self._circle_radius[circle_start:circle_end]
+        circle_friction = self._friction_coeffs[circle_start:circle_end]
+
+        if NUMBA_AVAILABLE:
+            _kernels.ball_circle_collisions(
+                ball_positions,
+                ball_velocities,
+                ball_radii,
+                ball_restitutions,
+                ball_friction,
+                circle_positions,
+                circle_radii,
+                circle_friction,
+                self.friction_enabled,
+            )
+            return
+
+        # Candidate (ball, circle) pairs from one broadcast overlap test,
+        # resolved in ball-major order like the full double loop. A ball
+        # only moves once it hits its first circle, and may be pushed into
+        # a later one, so every circle from the first hit on stays a
+        # candidate; the resolver repeats the exact test.
+        deltas = ball_positions[:, np.newaxis, :] - circle_positions[np.newaxis, :, :]
+        dist_sq = np.einsum("ijk,ijk->ij", deltas, deltas)
+        reach = ball_radii[:, np.newaxis] + circle_radii[np.newaxis, :]
+        reach *= CANDIDATE_MARGIN
+        hits = dist_sq < reach * reach
+        pairs_i, pairs_j = np.nonzero(np.logical_or.accumulate(hits, axis=1))
+        if len(pairs_i) == 0:
+            return
+
+        self._resolve_ball_circle_pairs(
+            pairs_i.tolist(),
+            pairs_j.tolist(),
+            ball_positions,
+            ball_velocities,
+            ball_radii,
+            ball_restitutions,
+            ball_friction,
+            circle_positions,
+            circle_radii,
+            circle_friction,
         )
-        ball_indices = np.where(ball_mask)[0]
-        circle_indices = np.where(circle_mask)[0]
-        if len(ball_indices) == 0 or len(circle_indices) == 0:
+
+    def _resolve_ball_circle_pairs(
+        self,
+        pairs_i: list[int],
+        pairs_j: list[int],
+        ball_positions: np.ndarray,
+        ball_velocities: np.ndarray,
+        ball_radii: np.ndarray,
+        ball_restitutions: np.ndarray,
+        ball_friction_coeffs: np.ndarray,
+        circle_positions: np.ndarray,
+        circle_radii: np.ndarray,
+        circle_friction_coeffs: np.ndarray,
+    ) -> None:
+        pos = ball_positions.tolist()
+        vel = ball_velocities.tolist()
+        radius = ball_radii.tolist()
+        restitution = ball_restitutions.tolist()
+        ball_friction = ball_friction_coeffs.tolist()
+        circle_pos = circle_positions.tolist()
+        circle_radius = circle_radii.tolist()
+        circle_friction = circle_friction_coeffs.tolist()
+        for i, j in zip(pairs_i, pairs_j):
+            pos_i, vel_i = pos[i], vel[i]
+            dx = pos_i[0] - circle_pos[j][0]
+            dy = pos_i[1] - circle_pos[j][1]
+            dist_sq = dx * dx + dy * dy
+            min_distance = radius[i] + circle_radius[j]
+            if dist_sq >= min_distance * min_distance or dist_sq <= EPS * EPS:
+                continue
+            distance = math.sqrt(dist_sq)
+            self._bounce_off_static(
+                pos_i,
+                vel_i,
+                dx / distance,
+                dy / distance,
+                min_distance - distance,
+                restitution[i],
+                (ball_friction[i] + circle_friction[j]) / 2.0,
+            )
+
+        ball_positions[:] = pos
+        ball_velocities[:] = vel
+
+    def _bounce_off_static(
+        self,
+        pos: list[float],
+        vel: list[float],
+        nx: float,
+        ny: float,
+        overlap: float,
+        restitution: float,
+        friction_coeff: float,
+    ) -> None:
+        # Response of one ball, as [x, y] lists, against an immovable
+        # surface with outward normal (nx, ny)
+        v_normal = vel[0] * nx + vel[1] * ny
+        if v_normal >= 0:
             return
+        # Normal velocity change, reused as the friction bound below
+        bounce = (1.0 + restitution) * v_normal
+        vel[0] -= bounce * nx
+        vel[1] -= bounce * ny
+        if overlap > 0:
+            pos[0] += nx * overlap
+            pos[1] += ny * overlap
 
-        ball_positions = self._positions[ball_indices]
-        ball_velocities = self._velocities[ball_indices]
-        ball_radii = self._type_properties[EntityType.BALL]["radius"][ball_indices]
-        ball_restitutions = self._restitutions[ball_indices]
-
-        circle_positions = self._positions[circle_indices]
-        circle_radii = self._type_properties[EntityType.CIRCLE_OBSTACLE]["radius"][
-            circle_indices
-        ]
-
-        for i, ball_idx in enumerate(ball_indices):
-            for j, circle_idx in enumerate(circle_indices):
-                delta = ball_positions[i] - circle_positions[j]
-                distance = np.linalg.norm(delta)
-                min_distance = ball_radii[i] + circle_radii[j]
-                if distance < min_distance and distance > EPS:
-                    normal = delta / distance
-                    v_normal = np.dot(ball_velocities[i], normal)
-                    if v_normal >= 0:
-                        continue
-                    ball_velocities[i] -= (
-                        (1.0 + ball_restitutions[i]) * v_normal * normal
-                    )
-                    overlap = min_distance - distance
-                    if overlap > 0:
-                        ball_positions[i] += normal * overlap
-
-                    if self.friction_enabled:
-                        tangential_velocity = (
-                            ball_velocities[i]
-                            - np.dot(ball_velocities[i], normal) * normal
-                        )
-                        tangential_speed = np.linalg.norm(tangential_velocity)
-                        if tangential_speed > EPS:
-                            tangent = tangential_velocity / tangential_speed
-                            friction_coeff = (
-                                self._friction_coeffs[ball_idx]
-                                + self._friction_coeffs[circle_idx]
-                            ) / 2.0
-                            normal_impulse = (1.0 + ball_restitutions[i]) * abs(
-                                v_normal
-                            )
-                            friction_impulse = friction_coeff * normal_impulse * tangent
-                            ball_velocities[i] -= friction_impulse
-
-        self._positions[ball_indices] = ball_positions
-        self._velocities[ball_indices] = ball_velocities
+        if self.friction_enabled:
+            remaining_normal = vel[0] * nx + vel[1] * ny
+            tx = vel[0] - remaining_normal * nx
+            ty = vel[1] - remaining_normal * ny
+            tangential_speed = math.sqrt(tx * tx + ty * ty)
+            if tangential_speed > EPS:
+                scale = friction_coeff * abs(bounce) / tangential_speed
+                vel[0] -= scale * tx
+                vel[1] -= scale * ty
 
     def _handle_ball_rectangle_obstacle_collisions_vectorized(self) -> None:
-        n = self._n_entities
-        ball_mask = self._dynamic_mask[:n] & (self._entity_types[:n] == EntityType.BALL)
-        rect_mask = self._is_static[:n] & (
-            self._entity_types[:n] == EntityType.RECTANGLE_OBSTACLE
-        )
-        ball_indices = np.where(ball_mask)[0]
-        rect_indices = np.where(rect_mask)[0]
-        if len(ball_indices) == 0 or len(rect_indices) == 0:
+        ball_start, ball_end = self._block_range(EntityType.BALL)
+        rect_start, rect_end = self._block_range(EntityType.RECTANGLE_OBSTACLE)
+        if ball_start == ball_end or rect_start == rect_end:
+            return
+
+        ball_positions = self._positions[ball_start:ball_end]
+        ball_velocities = self._velocities[ball_start:ball_end]
+        ball_radii = self._ball_radius[ball_start:ball_end]
+        ball_restitutions = self._restitutions[ball_start:ball_end]
+        ball_friction = self._friction_coeffs[ball_start:ball_end]
+
+        rect_positions = self._positions[rect_start:rect_end]
+        rect_widths = self._rect_width[rect_start:rect_end]
+        rect_heights = self._rect_height[rect_start:rect_end]
+        rect_friction = self._friction_coeffs[rect_start:rect_end]
+
+        half_widths = rect_widths / 2.0
+        half_heights = rect_heights / 2.0
+        if NUMBA_AVAILABLE:
+            _kernels.ball_rectangle_collisions(
+                ball_positions,
+                ball_velocities,
+                ball_radii,
+                ball_restitutions,
+                ball_friction,
+                rect_positions,
+                half_widths,
+                half_heights,
+                rect_friction,
+                self.friction_enabled,
+            )
             return
 
-        ball_positions = self._positions[ball_indices]
-        ball_velocities = self._velocities[ball_indices]
-        ball_radii = self._type_properties[EntityType.BALL]["radius"][ball_indices]
-        ball_restitutions = self._restitutions[ball_indices]
-
-        rect_positions = self._positions[rect_indices]
-        rect_widths = self._type_properties[EntityType.RECTANGLE_OBSTACLE]["width"][
-            rect_indices
-        ]
-        rect_heights = self._type_properties[EntityType.RECTANGLE_OBSTACLE]["height"][
-            rect_indices
-        ]
-
-        for i, ball_idx in enumerate(ball_indices):
-            for j, rect_idx in enumerate(rect_indices):
-                rect_x = rect_positions[j][0]
-                rect_y = rect_positions[j][1]
-                half_width = rect_widths[j] / 2.0
-                half_height = rect_heights[j] / 2.0
-
-                rect_left = rect_x - half_width
-                rect_right = rect_x + half_width
-                rect_bottom = rect_y - half_height
-                rect_top = rect_y + half_height
-
-                ball_x = ball_positions[i][0]
-                ball_y = ball_positions[i][1]
-
-                closest_x = np.clip(ball_x, rect_left, rect_right)
-                closest_y = np.clip(ball_y, rect_bottom, rect_top)
-
-                delta_x = ball_x - closest_x
-                delta_y = ball_y - closest_y
-                distance = np.sqrt(delta_x**2 + delta_y**2)
-
-                if distance < ball_radii[i]:
-                    if distance < EPS:
-                        dist_left = abs(ball_x - rect_left)
-                        dist_right = abs(ball_x - rect_right)
-                        dist_bottom = abs(ball_y - rect_bottom)
-                        dist_top = abs(ball_y - rect_top)
-                        min_dist = min(dist_left, dist_right, dist_bottom, dist_top)
-                        if min_dist == dist_left:
-                            normal = np.array([-1.0, 0.0])
-                            overlap = ball_radii[i] + dist_left
-                        elif min_dist == dist_right:
-                            normal = np.array([1.0, 0.0])
-                            overlap = ball_radii[i] + dist_right
-                        elif min_dist == dist_bottom:
-                            normal = np.array([0.0, -1.0])
-                            overlap = ball_radii[i] + dist_bottom
-                        else:
-                            normal = np.array([0.0, 1.0])
-                            overlap = ball_radii[i] + dist_top
-                    else:
-                        normal = np.array([delta_x / distance, delta_y / distance])
-                        overlap = ball_radii[i] - distance
-
-                    v_normal = np.dot(ball_velocities[i], normal)
-                    if v_normal >= 0:
-                        continue
-
-                    ball_velocities[i] -= (
-                        (1.0 + ball_restitutions[i]) * v_normal * normal
-                    )
-                    if overlap > 0:
-                        ball_positions[i] += normal * overlap
-
-                    if self.friction_enabled:
-                        tangential_velocity = (
-                            ball_velocities[i]
-                            - np.dot(ball_velocities[i], normal) * normal
-                        )
-                        tangential_speed = np.linalg.norm(tangential_velocity)
-                        if tangential_speed > EPS:
-                            tangent = tangential_velocity / tangential_speed
-                            friction_coeff = (
-                                self._friction_coeffs[ball_idx]
-                                + self._type_properties[EntityType.RECTANGLE_OBSTACLE][
-                                    "friction_coefficient"
-                                ][j]
-                            ) / 2.0
-                            normal_impulse = (1.0 + ball_restitutions[i]) * abs(
-                                v_normal
-                            )
-                            friction_impulse = friction_coeff * normal_impulse * tangent
-                            ball_velocities[i] -= friction_impulse
-
-        self._positions[ball_indices] = ball_positions
-        self._velocities[ball_indices] = ball_velocities
+        # Offset from every ball to the closest point of every rectangle,
+        # shape (B, R). The half extents broadcast against the (B, 1) ball
+        # columns, and each (B, R) buffer is reused in place down to the
+        # squared distance.
+        ball_x = ball_positions[:, 0:1]
+        ball_y = ball_positions[:, 1:2]
+        offset_x = np.maximum(ball_x, rect_positions[:, 0] - half_widths)
+        np.minimum(offset_x, rect_positions[:, 0] + half_widths, out=offset_x)
+        offset_x -= ball_x
+        offset_y = np.maximum(ball_y, rect_positions[:, 1] - half_heights)
+        np.minimum(offset_y, rect_positions[:, 1] + half_heights, out=offset_y)
+        offset_y -= ball_y
+        dist_sq = np.square(offset_x, out=offset_x)
+        dist_sq += np.square(offset_y, out=offset_y)
+        reach_sq = ball_radii * CANDIDATE_MARGIN
+        reach_sq *= reach_sq
+        # Every rectangle from a ball's first hit on stays a candidate: the
+        # push out of one rectangle can move the ball into a later one
+        hits = dist_sq < reach_sq[:, np.newaxis]
+        pairs_i, pairs_j = np.nonzero(np.logical_or.accumulate(hits, axis=1))
+        if len(pairs_i) == 0:
+            return
+
+        self._resolve_ball_rectangle_pairs(
+            pairs_i.tolist(),
+            pairs_j.tolist(),
+            ball_positions,
+            ball_velocities,
+            ball_radii,
+            ball_restitutions,
+            ball_friction,
+            rect_positions,
+            half_widths,
+            half_heights,
+            rect_friction,
+        )
+
+    def _resolve_ball_rectangle_pairs(
+        self,
+        pairs_i: list[int],
+        pairs_j: list[int],
+        ball_positions: np.ndarray,
+        ball_velocities: np.ndarray,
+        ball_radii: np.ndarray,
+        ball_restitutions: np.ndarray,
+        ball_friction_coeffs: np.ndarray,
+        rect_positions: np.ndarray,
+        half_widths: np.ndarray,
+        half_heights: np.ndarray,
+        rect_friction_coeffs: np.ndarray,
+    ) -> None:
+        pos = ball_positions.tolist()
+        vel = ball_velocities.tolist()
+        radius = ball_radii.tolist()
+        restitution = ball_restitutions.tolist()
+        ball_friction = ball_friction_coeffs.tolist()
+        rect_pos = rect_positions.tolist()
+        half_w = half_widths.tolist()
+        half_h = half_heights.tolist()
+        rect_friction = rect_friction_coeffs.tolist()
+        for i, j in zip(pairs_i, pairs_j):
+            rect_x, rect_y = rect_pos[j]
+            rect_left = rect_x - half_w[j]
+            rect_right = rect_x + half_w[j]
+            rect_bottom = rect_y - half_h[j]
+            rect_top = rect_y + half_h[j]
+
+            pos_i = pos[i]
+            ball_x, ball_y = pos_i
+            closest_x = min(max(ball_x, rect_left), rect_right)
+            closest_y = min(max(ball_y, rect_bottom), rect_top)
+            delta_x = ball_x - closest_x
+            delta_y = ball_y - closest_y
+            dist_sq = delta_x * delta_x + delta_y * delta_y
+            if dist_sq >= radius[i] * radius[i]:
+                continue
+
+            if dist_sq < EPS * EPS:
+                # Centre inside the rectangle: push out through the nearest
+                # edge (left, right, bottom, top; first wins on ties)
+                edge_distances = [
+                    abs(ball_x - rect_left),
+                    abs(ball_x - rect_right),
+                    abs(ball_y - rect_bottom),
+                    abs(ball_y - rect_top),
+                ]
+                edge = edge_distances.index(min(edge_distances))
+                nx, ny = _EDGE_NORMALS[edge]
+                overlap = radius[i] + edge_distances[edge]
+            else:
+                distance = math.sqrt(dist_sq)
+                nx = delta_x / distance
+                ny = delta_y / distance
+                overlap = radius[i] - distance
+
+            self._bounce_off_static(
+                pos_i,
+                vel[i],
+                nx,
+                ny,
+                overlap,
+                restitution[i],
+                (ball_friction[i] + rect_friction[j]) / 2.0,
+            )
+
+        ball_positions[:] = pos
+        ball_velocities[:] = vel
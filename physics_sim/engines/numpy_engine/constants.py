@@ -1,2 +1,10 @@
 EPS: float = 1e-10
+# Relative slack on vectorized overlap tests that pre-filter collision pairs
+CANDIDATE_MARGIN: float = 1.0 + 1e-4
+# Ball counts from which ball-ball candidates come from the uniform grid; the
+# Numba all-pairs loop stays cheaper than building the grid for longer
+GRID_BROADPHASE_THRESHOLD: int = 128
+GRID_BROADPHASE_THRESHOLD_NUMBA: int = 1024
 INITIAL_CAPACITY: int = 16
+# Row count from which the Numba kernels switch to their prange variants
+PARALLEL_THRESHOLD: int = 2048
@@ -5,84 +5,122 @@ from .types import EntityType
 
 class DataExportMixin:
     def get_render_data(self) -> list[dict]:
-        render_data: list[dict] = []
-        for i in range(self._n_entities):
-            entity_type = EntityType(self._entity_types[i])
-            base = {
-                "id": self._entity_ids[i],
-                "type": entity_type.name,
-                "position": tuple(self._positions[i]),
+        if self._render_cache_version == self._state_version:
+            return self._render_cache
+        n = self._n_entities
+        # One .tolist() per column instead of a float()/tuple() unbox per row
+        entity_ids = self._entity_ids[:n].tolist()
+        positions = self._positions[:n].tolist()
+
+        # Each type owns a contiguous block of rows, so its rows are a range
+        # rather than a scan of _entity_types
+        start, end = self._block_range(EntityType.BALL)
+        render_data: list[dict] = [
+            {
+                "id": entity_ids[i],
+                "type": "BALL",
+                "position": tuple(positions[i]),
+                "render_type": "circle",
+                "radius": radius,
+                "color": self._ball_color[i],
             }
-            if entity_type == EntityType.BALL:
-                base.update({
-                    "render_type": "circle",
-                    "radius": float(
-                        self._type_properties[EntityType.BALL]["radius"][i]
-                    ),
-                    "color": self._type_properties[EntityType.BALL]["color"][i],
-                })
-            elif entity_type == EntityType.RECTANGLE_OBSTACLE:
-                base.update({
-                    "render_type": "rectangle",
-                    "width": float(
-                        self._type_properties[EntityType.RECTANGLE_OBSTACLE]["width"][i]
-                    ),
-                    "height": float(
-                        self._type_properties[EntityType.RECTANGLE_OBSTACLE]["height"][
-                            i
-                        ]
-                    ),
-                    "color": self._type_properties[EntityType.RECTANGLE_OBSTACLE][
-                        "color"
-                    ][i],
-                })
-            elif entity_type == EntityType.CIRCLE_OBSTACLE:
-                base.update({
-                    "render_type": "circle_static",
-                    "radius": float(
-                        self._type_properties[EntityType.CIRCLE_OBSTACLE]["radius"][i]
-                    ),
-                    "color": self._type_properties[EntityType.CIRCLE_OBSTACLE]["color"][
-                        i
-                    ],
-                })
-            render_data.append(base)
+            for i, radius in zip(
+                range(start, end), self._ball_radius[start:end].tolist()
+            )
+        ]
+
+        start, end = self._block_range(EntityType.RECTANGLE_OBSTACLE)
+        render_data.extend(
+            {
+                "id": entity_ids[i],
+                "type": "RECTANGLE_OBSTACLE",
+                "position": tuple(positions[i]),
+                "render_type": "rectangle",
+                "width": width,
+                "height": height,
+                "color": self._rect_color[i],
+            }
+            for i, width, height in zip(
+                range(start, end),
+                self._rect_width[start:end].tolist(),
+                self._rect_height[start:end].tolist(),
+            )
+        )
+
+        start, end = self._block_range(EntityType.CIRCLE_OBSTACLE)
+        render_data.extend(
+            {
+                "id": entity_ids[i],
+                "type": "CIRCLE_OBSTACLE",
+                "position": tuple(positions[i]),
+                "render_type": "circle_static",
+                "radius": radius,
+                "color": self._circle_color[i],
+            }
+            for i, radius in zip(
+                range(start, end), self._circle_radius[start:end].tolist()
+            )
+        )
+
+        self._render_cache = render_data
+        self._render_cache_version = self._state_version
         return render_data
 
     def get_inventory_data(self) -> list[dict]:
+        if self._inventory_cache_version == self._state_version:
+            return self._inventory_cache
+        # Only dynamic entities are listed, and they are packed at the front
+        nd = self._n_dynamic
+        # Without force tracking the log is stale, so no forces are listed
+        force_names = self._force_log_names if self.track_forces else []
+        # One .tolist() per column instead of a float()/tuple() unbox per row
+        entity_ids = self._entity_ids[:nd].tolist()
+        entity_types = self._entity_types[:nd].tolist()
+        masses = self._masses[:nd].tolist()
+        positions = self._positions[:nd].tolist()
+        velocities = self._velocities[:nd]
+        speeds = np.sqrt(np.einsum("ij,ij->i", velocities, velocities)).tolist()
+        velocities = velocities.tolist()
+        accelerations = self._accelerations[:nd].tolist()
+        radii = self._ball_radius[:nd].tolist()
+        restitutions = self._restitutions[:nd].tolist()
+        force_log = self._force_log[:nd]
+        force_magnitudes = np.sqrt(np.einsum("ijk,ijk->ij", force_log, force_log))
+        force_magnitudes = force_magnitudes.tolist()
+        force_log = force_log.tolist()
+
         data: list[dict] = []
-        for i in range(self._n_entities):
-            if not self._dynamic_mask[i]:
-                continue
-            entity_type = EntityType(self._entity_types[i])
+        for i in range(nd):
+            entity_type = EntityType(entity_types[i])
             entry = {
-                "id": self._entity_ids[i],
+                "id": entity_ids[i],
                 "type": entity_type.name,
-                "mass": float(self._masses[i]),
-                "position": tuple(self._positions[i]),
-                "velocity": tuple(self._velocities[i]),
-                "speed": float(np.linalg.norm(self._velocities[i])),
-                "acceleration": tuple(self._accelerations[i]),
+                "mass": masses[i],
+                "position": tuple(positions[i]),
+                "velocity": tuple(velocities[i]),
+                "speed": speeds[i],
+                "acceleration": tuple(accelerations[i]),
                 "applied_forces": [
-                    {
-                        "name": name,
-                        "vector": tuple(vec),
-                        "magnitude": float(np.linalg.norm(vec)),
-                    }
-                    for name, vec in self._applied_forces[i]
+                    {"name": name, "vector": tuple(vec), "magnitude": magnitude}
+                    for name, vec, magnitude in zip(
+                        force_names, force_log[i], force_magnitudes[i]
+                    )
                 ],
             }
             if entity_type == EntityType.BALL:
-                entry["radius"] = float(
-                    self._type_properties[EntityType.BALL]["radius"][i]
-                )
-                entry["restitution"] = float(self._restitutions[i])
+                entry["radius"] = radii[i]
+                entry["restitution"] = restitutions[i]
             data.append(entry)
+        self._inventory_cache = data
+        self._inventory_cache_version = self._state_version
         return data
 
     def get_entity_counts_by_type(self) -> dict[str, int]:
-        counts: dict[str, int] = {}
-        for i in range(self._n_entities):
-            name = EntityType(self._entity_types[i]).name
-            counts[name] = counts.get(name, 0) + 1
-        return counts
+        counts = np.bincount(
+            self._entity_types[: self._n_entities], minlength=len(EntityType)
+        )
+        return {
+            EntityType(code).name: int(count)
+            for code, count in enumerate(counts)
+            if count
+        }
@@ -1,19 +1,26 @@
 import numpy as np
 
+from physics_sim.core._dtypes import ACCUM_DTYPE
+
 
 class EnergyMixin:
     def get_energies(self) -> dict[str, float]:
         if self._n_entities == 0:
             return {"kinetic": 0.0, "potential": 0.0, "total": 0.0}
-        n = self._n_entities
-        dyn = self._dynamic_mask[:n]
-        velocities_sq = np.sum(self._velocities[:n][dyn] ** 2, axis=1)
-        kinetic = float(0.5 * np.sum(self._masses[:n][dyn] * velocities_sq))
+        n_dynamic = self._n_dynamic
+        masses = self._masses[:n_dynamic]
+        positions = self._positions[:n_dynamic]
+        velocities = self._velocities[:n_dynamic]
+        # Accumulate in double precision; the float32 state would otherwise
+        # show rounding drift in the energy readout over long runs
+        kinetic = 0.5 * float(
+            np.einsum("i,ij,ij->", masses, velocities, velocities, dtype=ACCUM_DTYPE)
+        )
         potential = 0.0
-        for force in self.forces:
+        for force in self._forces_tuple:
             potential += force.get_potential_energy_contribution(
-                positions=self._positions[:n][dyn],
-                masses=self._masses[:n][dyn],
+                positions=positions,
+                masses=masses,
             )
         total = kinetic + potential
         return {"kinetic": kinetic, "potential": potential, "total": total}
@@ -3,6 +3,7 @@ from typing import Any
 import numpy as np
 
 from physics_sim.core import PhysicsEngine
+from physics_sim.core._dtypes import STATE_DTYPE
 
 from .boundary_mixin import BoundaryMixin
 from .collision_mixin import CollisionMixin
@@ -13,6 +14,7 @@ from .force_mixin import ForceMixin
 from .integration_mixin import IntegrationMixin
 from .pbd_mixin import PBDMixIn
 from .storage_mixin import StorageMixin
+from .types import EntityType
 
 
 class NumpyPhysicsEngine(
@@ -27,10 +29,23 @@ class NumpyPhysicsEngine(
     EnergyMixin,
     PhysicsEngine,
 ):
-    def __init__(self, bounds: tuple[float, float]):
+    def __init__(self, bounds: tuple[float, float], track_forces: bool = True):
         PhysicsEngine.__init__(self, bounds)
         StorageMixin.__init__(self)
         self._paused: bool = False
+        # Record each force's per-entity vector for the inventory panel;
+        # headless runs can turn it off to keep the step loop lean
+        self.track_forces = track_forces
+
+    @property
+    def track_forces(self) -> bool:
+        return self._track_forces
+
+    @track_forces.setter
+    def track_forces(self, enabled: bool) -> None:
+        self._track_forces = enabled
+        # The inventory only lists forces while they are tracked
+        self._state_version += 1
 
     def step(self, dt: float) -> None:
         """Advance simulation using vectorized Euler integration with PBD constraints."""
@@ -38,17 +53,21 @@ class NumpyPhysicsEngine(
             return
 
         n = self._n_entities
-        dyn = self._dynamic_mask[:n]
-        if dyn.sum() == 0:
+        # Dynamic entities occupy rows [0, n_dynamic); every stage below
+        # works on that contiguous block
+        n_dynamic = self._n_dynamic
+        if n_dynamic == 0:
             return
 
-        self._prev_positions = self._positions[:n][dyn].copy()
+        self._state_version += 1
+        self._prev_positions[:n_dynamic] = self._positions[:n_dynamic]
 
-        self._reset_accelerations(dyn, n)
-        self._clear_applied_forces(n)
-        self._apply_forces(dt, dyn, n)
-        self._integrate_euler(dt, dyn, n)
-        self._apply_constraints(dt, dyn, n)
+        self._reset_accelerations(n_dynamic)
+        if self.track_forces:
+            self._reset_force_log(n)
+        self._apply_forces(dt, n_dynamic)
+        self._integrate_euler(dt, n_dynamic)
+        self._apply_constraints(dt, n_dynamic)
 
         self._handle_boundary_collisions_vectorized()
         self._handle_ball_ball_collisions_vectorized()
@@ -59,9 +78,9 @@ class NumpyPhysicsEngine(
             return {"vector_field": np.zeros((0, 2)), "overlays": []}
 
         # Mocked batch for visualization sampling
-        positions = np.asarray(sample_points, dtype=np.float64)
+        positions = np.asarray(sample_points, dtype=STATE_DTYPE)
         velocities = np.zeros_like(positions)
-        masses = np.ones((len(positions),), dtype=np.float64)
+        masses = np.ones((len(positions),), dtype=STATE_DTYPE)
         entity_types = np.zeros((len(positions),), dtype=np.int32)
         dt = 0.0
 
@@ -72,14 +91,28 @@ class NumpyPhysicsEngine(
             "all_velocities": self._velocities[:n].copy(),
             "all_masses": self._masses[:n].copy(),
             "entity_types": self._entity_types[:n].copy(),
-            "type_properties": self._type_properties,
+            "type_properties": {
+                EntityType.BALL: {
+                    "radius": self._ball_radius,
+                    "color": self._ball_color,
+                },
+                EntityType.RECTANGLE_OBSTACLE: {
+                    "width": self._rect_width,
+                    "height": self._rect_height,
+                    "color": self._rect_color,
+                },
+                EntityType.CIRCLE_OBSTACLE: {
+                    "radius": self._circle_radius,
+                    "color": self._circle_color,
+                },
+            },
             "dynamic_mask": self._dynamic_mask[:n].copy(),
         }
 
-        accumulated = np.zeros_like(positions, dtype=np.float64)
+        accumulated = np.zeros_like(positions)
         overlays: list[dict[str, Any]] = []
 
-        for force in self.forces:
+        for force in self._forces_tuple:
             try:
                 vecs = force.apply_force(
                     positions=positions,
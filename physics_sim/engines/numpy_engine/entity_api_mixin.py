@@ -1,5 +1,3 @@
-import numpy as np
-
 from physics_sim.core import Entity
 from physics_sim.entities import (
     Ball,
@@ -7,120 +5,146 @@ from physics_sim.entities import (
     RectangleObstacle,
 )
 
-from .types import ENTITY_CLASS_TO_TYPE, EntityType
+from .types import (
+    ENTITY_CLASS_TO_TYPE,
+    N_DYNAMIC_BLOCKS,
+    ROW_BLOCK_INDEX,
+    EntityType,
+)
 
 
 class EntityApiMixin:
     def add_entity(self, entity: Entity) -> None:
         if self._n_entities >= self._capacity:
             self._grow_arrays()
-        idx = self._n_entities
         entity_id = entity.id
         etype = ENTITY_CLASS_TO_TYPE.get(type(entity))
         if etype is None:
             raise ValueError(f"Unsupported entity type: {type(entity)}")
+        # Open a row at the end of the type's block: every later block
+        # shifts up by one by moving its first row past its end
+        block = ROW_BLOCK_INDEX[etype]
+        ends = self._block_ends
+        for later in range(len(ends) - 1, block, -1):
+            self._move_row(ends[later - 1], ends[later])
+            ends[later] += 1
+        idx = ends[block]
+        ends[block] += 1
+        self._n_dynamic = ends[N_DYNAMIC_BLOCKS - 1]
         if etype == EntityType.BALL:
             self._add_ball(entity, idx)
         elif etype == EntityType.RECTANGLE_OBSTACLE:
             self._add_rectangle_obstacle(entity, idx)
         elif etype == EntityType.CIRCLE_OBSTACLE:
             self._add_circle_obstacle(entity, idx)
+        self._force_log[idx] = 0.0
         self._entity_ids[idx] = entity_id
         self._id_to_index[entity_id] = idx
         self._n_entities += 1
+        self._state_version += 1
 
     def _add_ball(self, ball: Ball, idx: int) -> None:
         self._positions[idx] = ball.position
         self._entity_types[idx] = EntityType.BALL
         self._is_static[idx] = False
         self._dynamic_mask[idx] = True
+        self._drag_mask[idx] = ball.drag_enabled
         self._velocities[idx] = ball.velocity
+        self._accelerations[idx] = 0.0
         self._masses[idx] = ball.mass
+        self._inv_masses[idx] = 1.0 / ball.mass
         self._restitutions[idx] = ball.restitution
         self._drag_coeffs[idx] = ball.drag_coefficient
         self._cross_sections[idx] = ball.cross_sectional_area
         self._friction_coeffs[idx] = ball.friction_coefficient
-        self._type_properties[EntityType.BALL]["radius"][idx] = ball.radius
-        self._type_properties[EntityType.BALL]["color"][idx] = ball.color
+        self._ball_radius[idx] = ball.radius
+        self._ball_color[idx] = ball.color
 
     def _add_rectangle_obstacle(self, obstacle: RectangleObstacle, idx: int) -> None:
-        self._positions[idx] = np.array([
-            obstacle.position.x
-            if hasattr(obstacle.position, "x")
-            else obstacle.position[0],
-            obstacle.position.y
-            if hasattr(obstacle.position, "y")
-            else obstacle.position[1],
-        ])
+        self._positions[idx] = obstacle.position
         self._entity_types[idx] = EntityType.RECTANGLE_OBSTACLE
         self._is_static[idx] = True
         self._dynamic_mask[idx] = False
-        self._type_properties[EntityType.RECTANGLE_OBSTACLE]["width"][idx] = (
-            obstacle.width
-        )
-        self._type_properties[EntityType.RECTANGLE_OBSTACLE]["height"][idx] = (
-            obstacle.height
-        )
-        self._type_properties[EntityType.RECTANGLE_OBSTACLE]["color"][idx] = (
-            obstacle.color
-        )
-        self._type_properties[EntityType.RECTANGLE_OBSTACLE]["friction_coefficient"][
-            idx
-        ] = obstacle.friction_coefficient
+        self._drag_mask[idx] = False
+        self._velocities[idx] = 0.0
+        self._accelerations[idx] = 0.0
+        self._masses[idx] = 0.0
+        self._inv_masses[idx] = 0.0
+        self._restitutions[idx] = 0.0
+        self._drag_coeffs[idx] = 0.0
+        self._cross_sections[idx] = 0.0
+        self._rect_width[idx] = obstacle.width
+        self._rect_height[idx] = obstacle.height
+        self._rect_color[idx] = obstacle.color
         self._friction_coeffs[idx] = obstacle.friction_coefficient
 
     def _add_circle_obstacle(self, obstacle: CircleObstacle, idx: int) -> None:
-        self._positions[idx] = np.array([
-            obstacle.position.x
-            if hasattr(obstacle.position, "x")
-            else obstacle.position[0],
-            obstacle.position.y
-            if hasattr(obstacle.position, "y")
-            else obstacle.position[1],
-        ])
+        self._positions[idx] = obstacle.position
         self._entity_types[idx] = EntityType.CIRCLE_OBSTACLE
         self._is_static[idx] = True
         self._dynamic_mask[idx] = False
-        self._type_properties[EntityType.CIRCLE_OBSTACLE]["radius"][idx] = (
-            obstacle.radius
-        )
-        self._type_properties[EntityType.CIRCLE_OBSTACLE]["color"][idx] = obstacle.color
-        self._type_properties[EntityType.CIRCLE_OBSTACLE]["friction_coefficient"][
-            idx
-        ] = obstacle.friction_coefficient
+        self._drag_mask[idx] = False
+        self._velocities[idx] = 0.0
+        self._accelerations[idx] = 0.0
+        self._masses[idx] = 0.0
+        self._inv_masses[idx] = 0.0
+        self._restitutions[idx] = 0.0
+        self._drag_coeffs[idx] = 0.0
+        self._cross_sections[idx] = 0.0
+        self._circle_radius[idx] = obstacle.radius
+        self._circle_color[idx] = obstacle.color
+        self._friction_coeffs[idx] = obstacle.friction_coefficient
 
-    def remove_entity(self, entity_id: str) -> None:
+    def remove_entity(self, entity_id: int) -> None:
         if entity_id not in self._id_to_index:
             return
         idx = self._id_to_index[entity_id]
-        last_idx = self._n_entities - 1
-        if idx != last_idx:
-            self._positions[idx] = self._positions[last_idx]
-            self._entity_types[idx] = self._entity_types[last_idx]
-            self._is_static[idx] = self._is_static[last_idx]
-            self._dynamic_mask[idx] = self._dynamic_mask[last_idx]
-            self._velocities[idx] = self._velocities[last_idx]
-            self._accelerations[idx] = self._accelerations[last_idx]
-            self._masses[idx] = self._masses[last_idx]
-            self._restitutions[idx] = self._restitutions[last_idx]
-            self._drag_coeffs[idx] = self._drag_coeffs[last_idx]
-            self._cross_sections[idx] = self._cross_sections[last_idx]
-            self._friction_coeffs[idx] = self._friction_coeffs[last_idx]
-            for _, props in self._type_properties.items():
-                for key, arr in props.items():
-                    if isinstance(arr, np.ndarray):
-                        arr[idx] = arr[last_idx]
-                    elif isinstance(arr, list):
-                        arr[idx] = arr[last_idx]
-            self._entity_ids[idx] = self._entity_ids[last_idx]
-            self._id_to_index[self._entity_ids[idx]] = idx
-            self._applied_forces[idx] = self._applied_forces[last_idx]
         del self._id_to_index[entity_id]
+        # Fill the hole from the end of its block; the hole then sits at
+        # the front of the next block and is refilled from that block's end
+        block = ROW_BLOCK_INDEX[EntityType(self._entity_types[idx])]
+        ends = self._block_ends
+        for later in range(block, len(ends)):
+            ends[later] -= 1
+            self._move_row(ends[later], idx)
+            idx = ends[later]
+        self._n_dynamic = ends[N_DYNAMIC_BLOCKS - 1]
         self._n_entities -= 1
+        self._state_version += 1
+
+    def _move_row(self, src: int, dst: int) -> None:
+        """Copy row src over row dst and repoint its id; src becomes free."""
+        if src == dst:
+            return
+        self._state[dst] = self._state[src]
+        self._entity_types[dst] = self._entity_types[src]
+        self._is_static[dst] = self._is_static[src]
+        self._dynamic_mask[dst] = self._dynamic_mask[src]
+        self._drag_mask[dst] = self._drag_mask[src]
+        self._accelerations[dst] = self._accelerations[src]
+        self._masses[dst] = self._masses[src]
+        self._inv_masses[dst] = self._inv_masses[src]
+        self._restitutions[dst] = self._restitutions[src]
+        self._drag_coeffs[dst] = self._drag_coeffs[src]
+        self._cross_sections[dst] = self._cross_sections[src]
+        self._friction_coeffs[dst] = self._friction_coeffs[src]
+        self._ball_radius[dst] = self._ball_radius[src]
+        self._ball_color[dst] = self._ball_color[src]
+        self._rect_width[dst] = self._rect_width[src]
+        self._rect_height[dst] = self._rect_height[src]
+        self._rect_color[dst] = self._rect_color[src]
+        self._circle_radius[dst] = self._circle_radius[src]
+        self._circle_color[dst] = self._circle_color[src]
+        self._entity_ids[dst] = self._entity_ids[src]
+        self._id_to_index[int(self._entity_ids[dst])] = dst
+        self._force_log[dst] = self._force_log[src]
 
     def clear(self) -> None:
         self._n_entities = 0
+        self._block_ends = [0] * len(self._block_ends)
+        self._n_dynamic = 0
         self._id_to_index.clear()
+        self._state_version += 1
 
     def get_supported_entity_types(self) -> list[type]:
         return [
@@ -129,7 +153,7 @@ class EntityApiMixin:
             CircleObstacle,
         ]
 
-    def get_entity_for_editing(self, entity_id: str) -> Entity | None:
+    def get_entity_for_editing(self, entity_id: int) -> Entity | None:
         if entity_id not in self._id_to_index:
             return None
         idx = self._id_to_index[entity_id]
@@ -138,9 +162,9 @@ class EntityApiMixin:
             return Ball(
                 position=self._positions[idx].copy(),
                 velocity=self._velocities[idx].copy(),
-                radius=float(self._type_properties[EntityType.BALL]["radius"][idx]),
+                radius=float(self._ball_radius[idx]),
                 mass=float(self._masses[idx]),
-                color=self._type_properties[EntityType.BALL]["color"][idx],
+                color=self._ball_color[idx],
                 restitution=float(self._restitutions[idx]),
                 drag_coefficient=float(self._drag_coeffs[idx]),
                 friction_coefficient=float(self._friction_coeffs[idx]),
@@ -149,25 +173,17 @@ class EntityApiMixin:
         if entity_type == EntityType.RECTANGLE_OBSTACLE:
             return RectangleObstacle(
                 position=self._positions[idx].copy(),
-                width=float(
-                    self._type_properties[EntityType.RECTANGLE_OBSTACLE]["width"][idx]
-                ),
-                height=float(
-                    self._type_properties[EntityType.RECTANGLE_OBSTACLE]["height"][idx]
-                ),
-                color=self._type_properties[EntityType.RECTANGLE_OBSTACLE]["color"][
-                    idx
-                ],
+                width=float(self._rect_width[idx]),
+                height=float(self._rect_height[idx]),
+                color=self._rect_color[idx],
                 friction_coefficient=float(self._friction_coeffs[idx]),
                 entity_id=entity_id,
             )
         if entity_type == EntityType.CIRCLE_OBSTACLE:
             return CircleObstacle(
                 position=self._positions[idx].copy(),
-                radius=float(
-                    self._type_properties[EntityType.CIRCLE_OBSTACLE]["radius"][idx]
-                ),
-                color=self._type_properties[EntityType.CIRCLE_OBSTACLE]["color"][idx],
+                radius=float(self._circle_radius[idx]),
+                color=self._circle_color[idx],
                 friction_coefficient=float(self._friction_coeffs[idx]),
                 entity_id=entity_id,
             )
@@ -181,39 +197,26 @@ class EntityApiMixin:
             self._positions[idx] = entity.position
             self._velocities[idx] = entity.velocity
             self._masses[idx] = entity.mass
+            self._inv_masses[idx] = 1.0 / entity.mass
             self._restitutions[idx] = entity.restitution
             self._drag_coeffs[idx] = entity.drag_coefficient
+            self._drag_mask[idx] = entity.drag_enabled
             self._cross_sections[idx] = entity.cross_sectional_area
             self._friction_coeffs[idx] = entity.friction_coefficient
-            self._type_properties[EntityType.BALL]["radius"][idx] = entity.radius
-            self._type_properties[EntityType.BALL]["color"][idx] = entity.color
+            self._ball_radius[idx] = entity.radius
+            self._ball_color[idx] = entity.color
         elif isinstance(entity, RectangleObstacle):
             self._positions[idx] = entity.position
-            self._type_properties[EntityType.RECTANGLE_OBSTACLE]["width"][idx] = (
-                entity.width
-            )
-            self._type_properties[EntityType.RECTANGLE_OBSTACLE]["height"][idx] = (
-                entity.height
-            )
-            self._type_properties[EntityType.RECTANGLE_OBSTACLE]["color"][idx] = (
-                entity.color
-            )
-            self._type_properties[EntityType.RECTANGLE_OBSTACLE][
-                "friction_coefficient"
-            ][idx] = entity.friction_coefficient
+            self._rect_width[idx] = entity.width
+            self._rect_height[idx] = entity.height
+            self._rect_color[idx] = entity.color
             self._friction_coeffs[idx] = entity.friction_coefficient
         elif isinstance(entity, CircleObstacle):
             self._positions[idx] = entity.position
-            self._type_properties[EntityType.CIRCLE_OBSTACLE]["radius"][idx] = (
-                entity.radius
-            )
-            self._type_properties[EntityType.CIRCLE_OBSTACLE]["color"][idx] = (
-                entity.color
-            )
-            self._type_properties[EntityType.CIRCLE_OBSTACLE]["friction_coefficient"][
-                idx
-            ] = entity.friction_coefficient
+            self._circle_radius[idx] = entity.radius
+            self._circle_color[idx] = entity.color
             self._friction_coeffs[idx] = entity.friction_coefficient
         else:
             return False
+        self._state_version += 1
         return True
@@ -1,25 +1,84 @@
 import numpy as np
 
+from physics_sim.core._dtypes import STATE_DTYPE
+from physics_sim.core._jit import NUMBA_AVAILABLE
+
+from . import _kernels
+from .constants import PARALLEL_THRESHOLD
+
 
 class ForceMixin:
-    def _clear_applied_forces(self, n: int) -> None:
-        for i in range(n):
-            self._applied_forces[i].clear()
+    def _reset_force_log(self, n: int) -> None:
+        # Dynamic rows are overwritten in place by _apply_forces every step,
+        # so the log only changes shape when the force set does. The engine
+        # swaps in a new _forces_tuple on every add/remove, which makes its
+        # identity a free version stamp for the force set.
+        if self._force_log_forces is self._forces_tuple:
+            return
+        n_forces = len(self._forces_tuple)
+        if self._force_log.shape[1] != n_forces:
+            self._force_log = np.zeros((self._capacity, n_forces, 2), dtype=STATE_DTYPE)
+        self._force_log_names = [force.name for force in self._forces_tuple]
+        self._force_log_forces = self._forces_tuple
+
+    def _apply_forces(self, dt: float, n_dynamic: int) -> None:
+        if not self._forces_tuple:
+            return
 
-    def _apply_forces(self, dt: float, dyn: np.ndarray, n: int) -> None:
-        for force in self.forces:
+        # The dynamic rows are packed at the front, so these are plain views;
+        # forces only read their inputs
+        positions = self._positions[:n_dynamic]
+        velocities = self._velocities[:n_dynamic]
+        masses = self._masses[:n_dynamic]
+        drag_coeffs = self._drag_coeffs[:n_dynamic]
+        cross_sections = self._cross_sections[:n_dynamic]
+        drag_mask = self._drag_mask[:n_dynamic]
+        entity_types = self._entity_types[:n_dynamic]
+
+        track_forces = self.track_forces
+        net_force = self._net_force[:n_dynamic]
+        net_force.fill(0.0)
+        # Constant accelerations (gravity) are summed once and added after
+        # the mass division; they are only expanded per row for the log
+        constant_ax = constant_ay = 0.0
+        for k, force in enumerate(self._forces_tuple):
+            if force.is_constant_accel:
+                accel = force.constant_accel_value()
+                constant_ax += float(accel[0])
+                constant_ay += float(accel[1])
+                if track_forces:
+                    np.multiply(
+                        masses[:, np.newaxis], accel, out=self._force_log[:n_dynamic, k]
+                    )
+                continue
             force_vectors = force.apply_force(
-                positions=self._positions[:n][dyn],
-                velocities=self._velocities[:n][dyn],
-                masses=self._masses[:n][dyn],
-                drag_coeffs=self._drag_coeffs[:n][dyn],
-                cross_sections=self._cross_sections[:n][dyn],
-                entity_types=self._entity_types[:n][dyn],
+                positions=positions,
+                velocities=velocities,
+                masses=masses,
+                drag_coeffs=drag_coeffs,
+                cross_sections=cross_sections,
+                drag_mask=drag_mask,
+                entity_types=entity_types,
                 dt=dt,
             )
-            masses_reshaped = self._masses[:n][dyn][:, np.newaxis]
-            self._accelerations[:n][dyn] += force_vectors / masses_reshaped
+            net_force += force_vectors
+            if track_forces:
+                self._force_log[:n_dynamic, k] = force_vectors
 
-            dyn_indices = np.where(dyn)[0]
-            for i, entity_idx in enumerate(dyn_indices):
-                self._applied_forces[entity_idx].append((force.name, force_vectors[i]))
+        if NUMBA_AVAILABLE:
+            kernel = (
+                _kernels.accumulate_accelerations_parallel
+                if n_dynamic >= PARALLEL_THRESHOLD
+                else _kernels.accumulate_accelerations
+            )
+            kernel(
+                self._accelerations[:n_dynamic],
+                net_force,
+                self._inv_masses[:n_dynamic],
+                constant_ax,
+                constant_ay,
+            )
+            return
+        net_force *= self._inv_masses[:n_dynamic, np.newaxis]
+        net_force += (constant_ax, constant_ay)
+        self._accelerations[:n_dynamic] += net_force
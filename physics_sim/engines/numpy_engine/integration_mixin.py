@@ -1,13 +1,39 @@
 import numpy as np
 
+from physics_sim.core._jit import NUMBA_AVAILABLE
+
+from . import _kernels
+from .constants import PARALLEL_THRESHOLD
+
 
 class IntegrationMixin:
-    def _reset_accelerations(self, dyn: np.ndarray, n: int) -> None:
-        self._accelerations[:n][dyn] = 0.0
+    def _reset_accelerations(self, n: int) -> None:
+        self._accelerations[:n] = 0.0
 
-    def _integrate_euler(self, dt: float, dyn: np.ndarray, n: int) -> None:
-        self._velocities[:n][dyn] += self._accelerations[:n][dyn] * dt
-        self._positions[:n][dyn] += self._velocities[:n][dyn] * dt
+    def _integrate_euler(self, dt: float, n_dynamic: int) -> None:
+        # Contiguous update of the packed dynamic block; static rows are
+        # never touched, so no dynamic-mask gather is needed.
+        if NUMBA_AVAILABLE:
+            kernel = (
+                _kernels.integrate_euler_parallel
+                if n_dynamic >= PARALLEL_THRESHOLD
+                else _kernels.integrate_euler
+            )
+            kernel(
+                self._positions[:n_dynamic],
+                self._velocities[:n_dynamic],
+                self._accelerations[:n_dynamic],
+                dt,
+            )
+            return
+        # Without Numba: the same semi-implicit update with every product
+        # written into scratch, so the step allocates no temporaries
+        velocities = self._velocities[:n_dynamic]
+        scratch = self._integration_scratch[:n_dynamic]
+        np.multiply(self._accelerations[:n_dynamic], dt, out=scratch)
+        velocities += scratch
+        np.multiply(velocities, dt, out=scratch)
+        self._positions[:n_dynamic] += scratch
 
     def pause(self) -> None:
         self._paused = True
@@ -2,19 +2,24 @@ import numpy as np
 
 
 class PBDMixIn:
-    def _apply_constraints(self, dt: float, dyn: np.ndarray, n: int) -> None:
-        for force in self.forces:
+    def _apply_constraints(self, dt: float, n_dynamic: int) -> None:
+        # Views of the packed dynamic block: each force projects the
+        # positions left by the previous one, directly in the state array
+        positions = self._positions[:n_dynamic]
+        velocities = self._velocities[:n_dynamic]
+        masses = self._masses[:n_dynamic]
+        entity_types = self._entity_types[:n_dynamic]
+        for force in self._forces_tuple:
             positions_new = force.apply_constraints(
-                positions=self._positions[:n][dyn],
-                velocities=self._velocities[:n][dyn],
-                masses=self._masses[:n][dyn],
-                entity_types=self._entity_types[:n][dyn],
+                positions=positions,
+                velocities=velocities,
+                masses=masses,
+                entity_types=entity_types,
                 dt=dt,
             )
 
             if positions_new is not None:
-                self._positions[:n][dyn] = positions_new
+                positions[:] = positions_new
 
-        self._velocities[:n][dyn] = (
-            self._positions[:n][dyn] - self._prev_positions
-        ) / dt
+        np.subtract(positions, self._prev_positions[:n_dynamic], out=velocities)
+        velocities /= dt
@@ -1,82 +1,129 @@
 import numpy as np
 
+from physics_sim.core._dtypes import STATE_DTYPE
+
 from .constants import INITIAL_CAPACITY
-from .types import EntityType
+from .types import ROW_BLOCK_INDEX, ROW_BLOCK_ORDER, EntityType
 
 
 class StorageMixin:
     def __init__(self) -> None:
         self._n_entities: int = 0
+        # End row of each type's block, in ROW_BLOCK_ORDER; rows
+        # [0, _n_dynamic) hold the dynamic entities, the rest are static
+        self._block_ends: list[int] = [0] * len(ROW_BLOCK_ORDER)
+        self._n_dynamic: int = 0
         self._capacity: int = INITIAL_CAPACITY
 
         self._prev_positions: np.ndarray = np.zeros(
-            (self._capacity, 2), dtype=np.float64
+            (self._capacity, 2), dtype=STATE_DTYPE
         )
-        self._positions: np.ndarray = np.zeros((self._capacity, 2), dtype=np.float64)
+        # Packed kinematic state, one row per entity: [pos_x, pos_y, vel_x, vel_y].
+        # _positions and _velocities are views into it and are rebuilt on growth.
+        self._state: np.ndarray = np.zeros((self._capacity, 4), dtype=STATE_DTYPE)
+        self._positions: np.ndarray = self._state[:, 0:2]
         self._entity_types: np.ndarray = np.zeros(self._capacity, dtype=np.int32)
         self._is_static: np.ndarray = np.zeros(self._capacity, dtype=bool)
 
         self._dynamic_mask: np.ndarray = np.zeros(self._capacity, dtype=bool)
-        self._velocities: np.ndarray = np.zeros((self._capacity, 2), dtype=np.float64)
+        # Rows drag applies to; lets drag skip them without per-entity checks
+        self._drag_mask: np.ndarray = np.zeros(self._capacity, dtype=bool)
+        self._velocities: np.ndarray = self._state[:, 2:4]
         self._accelerations: np.ndarray = np.zeros(
-            (self._capacity, 2), dtype=np.float64
+            (self._capacity, 2), dtype=STATE_DTYPE
+        )
+        # Per-step scratch, reused instead of reallocated every step: the
+        # summed force of each dynamic row, and the NumPy integration
+        # path's a*dt and v*dt terms
+        self._net_force: np.ndarray = np.zeros((self._capacity, 2), dtype=STATE_DTYPE)
+        self._integration_scratch: np.ndarray = np.zeros(
+            (self._capacity, 2), dtype=STATE_DTYPE
         )
-        self._masses: np.ndarray = np.zeros(self._capacity, dtype=np.float64)
-        self._restitutions: np.ndarray = np.zeros(self._capacity, dtype=np.float64)
-        self._drag_coeffs: np.ndarray = np.zeros(self._capacity, dtype=np.float64)
-        self._cross_sections: np.ndarray = np.zeros(self._capacity, dtype=np.float64)
-        self._friction_coeffs: np.ndarray = np.zeros(self._capacity, dtype=np.float64)
-
-        self._type_properties: dict[EntityType, dict] = {
-            EntityType.BALL: {
-                "radius": np.zeros(self._capacity, dtype=np.float64),
-                "color": [None] * self._capacity,
-            },
-            EntityType.RECTANGLE_OBSTACLE: {
-                "width": np.zeros(self._capacity, dtype=np.float64),
-                "height": np.zeros(self._capacity, dtype=np.float64),
-                "color": [None] * self._capacity,
-                "friction_coefficient": np.zeros(self._capacity, dtype=np.float64),
-            },
-            EntityType.CIRCLE_OBSTACLE: {
-                "radius": np.zeros(self._capacity, dtype=np.float64),
-                "color": [None] * self._capacity,
-                "friction_coefficient": np.zeros(self._capacity, dtype=np.float64),
-            },
-        }
-
-        self._entity_ids: list[str] = [None] * self._capacity
-        self._id_to_index: dict[str, int] = {}
-
-        self._applied_forces: list[list[tuple[str, np.ndarray]]] = [
-            [] for _ in range(self._capacity)
-        ]
+        self._masses: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        # 1 / mass, kept in step with _masses so the hot loops multiply
+        # instead of divide; 0 for obstacles, which act as infinite mass
+        self._inv_masses: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        self._restitutions: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        self._drag_coeffs: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        self._cross_sections: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        self._friction_coeffs: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+
+        # Per-type shape and colour columns, one attribute each so the hot
+        # paths skip a nested dict lookup; only the type's own block is set
+        self._ball_radius: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        self._ball_color: list = [None] * self._capacity
+        self._rect_width: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        self._rect_height: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        self._rect_color: list = [None] * self._capacity
+        self._circle_radius: np.ndarray = np.zeros(self._capacity, dtype=STATE_DTYPE)
+        self._circle_color: list = [None] * self._capacity
+
+        # Entity ids per row; ids are process-wide ints, so they fit an array
+        self._entity_ids: np.ndarray = np.zeros(self._capacity, dtype=np.int64)
+        self._id_to_index: dict[int, int] = {}
+
+        # Force log: [i, k] is the vector force k applied to row i last step,
+        # with the force names for the k axis kept alongside
+        self._force_log: np.ndarray = np.zeros(
+            (self._capacity, 0, 2), dtype=STATE_DTYPE
+        )
+        self._force_log_names: list[str] = []
+        # The _forces_tuple the log's layout and names were built for
+        self._force_log_forces: tuple = ()
+
+        # Export caches, valid while their version matches _state_version
+        self._render_cache: list[dict] = []
+        self._render_cache_version: int = -1
+        self._inventory_cache: list[dict] = []
+        self._inventory_cache_version: int = -1
+
+    def _block_range(self, etype: EntityType) -> tuple[int, int]:
+        """Return the [start, end) rows holding the entities of one type."""
+        block = ROW_BLOCK_INDEX[etype]
+        start = self._block_ends[block - 1] if block > 0 else 0
+        return start, self._block_ends[block]
 
     def _grow_arrays(self, min_additional: int = 1) -> None:
+        # Numeric rows past _n_entities are left uninitialized: every reader
+        # slices [:n], and add_entity writes each field of a row it claims
         new_capacity = max(self._capacity * 2, self._capacity + min_additional)
 
-        self._prev_positions = np.resize(self._prev_positions, (new_capacity, 2))
-        self._positions = np.resize(self._positions, (new_capacity, 2))
-        self._entity_types = np.resize(self._entity_types, new_capacity)
-        self._is_static = np.resize(self._is_static, new_capacity)
-
-        self._dynamic_mask = np.resize(self._dynamic_mask, new_capacity)
-        self._velocities = np.resize(self._velocities, (new_capacity, 2))
-        self._accelerations = np.resize(self._accelerations, (new_capacity, 2))
-        self._masses = np.resize(self._masses, new_capacity)
-        self._restitutions = np.resize(self._restitutions, new_capacity)
-        self._drag_coeffs = np.resize(self._drag_coeffs, new_capacity)
-        self._cross_sections = np.resize(self._cross_sections, new_capacity)
-        self._friction_coeffs = np.resize(self._friction_coeffs, new_capacity)
-
-        for _, props in self._type_properties.items():
-            for key, arr in props.items():
-                if isinstance(arr, np.ndarray):
-                    props[key] = np.resize(arr, new_capacity)
-                elif isinstance(arr, list):
-                    props[key].extend([None] * (new_capacity - self._capacity))
-
-        self._entity_ids.extend([None] * (new_capacity - self._capacity))
-        self._applied_forces.extend([[] for _ in range(new_capacity - self._capacity)])
+        self._prev_positions = _grow(self._prev_positions, new_capacity)
+        self._state = _grow(self._state, new_capacity)
+        self._positions = self._state[:, 0:2]
+        self._entity_types = _grow(self._entity_types, new_capacity)
+        self._is_static = _grow(self._is_static, new_capacity)
+
+        self._dynamic_mask = _grow(self._dynamic_mask, new_capacity)
+        self._drag_mask = _grow(self._drag_mask, new_capacity)
+        self._velocities = self._state[:, 2:4]
+        self._accelerations = _grow(self._accelerations, new_capacity)
+        self._net_force = _grow(self._net_force, new_capacity)
+        self._integration_scratch = _grow(self._integration_scratch, new_capacity)
+        self._masses = _grow(self._masses, new_capacity)
+        self._inv_masses = _grow(self._inv_masses, new_capacity)
+        self._restitutions = _grow(self._restitutions, new_capacity)
+        self._drag_coeffs = _grow(self._drag_coeffs, new_capacity)
+        self._cross_sections = _grow(self._cross_sections, new_capacity)
+        self._friction_coeffs = _grow(self._friction_coeffs, new_capacity)
+
+        self._ball_radius = _grow(self._ball_radius, new_capacity)
+        self._rect_width = _grow(self._rect_width, new_capacity)
+        self._rect_height = _grow(self._rect_height, new_capacity)
+        self._circle_radius = _grow(self._circle_radius, new_capacity)
+        new_rows = [None] * (new_capacity - self._capacity)
+        self._ball_color.extend(new_rows)
+        self._rect_color.extend(new_rows)
+        self._circle_color.extend(new_rows)
+
+        self._entity_ids = _grow(self._entity_ids, new_capacity)
+        self._force_log = _grow(self._force_log, new_capacity)
 
         self._capacity = new_capacity
+
+
+def _grow(arr: np.ndarray, new_capacity: int) -> np.ndarray:
+    """Return a C-contiguous copy of arr with room for new_capacity rows."""
+    out = np.empty((new_capacity,) + arr.shape[1:], dtype=arr.dtype)
+    out[: len(arr)] = arr
+    return out
@@ -25,3 +25,16 @@ ENTITY_TYPE_TO_CLASS: dict[EntityType, type] = {
     EntityType.RECTANGLE_OBSTACLE: RectangleObstacle,
     EntityType.CIRCLE_OBSTACLE: CircleObstacle,
 }
+
+# Rows are grouped into one contiguous block per type, in this order. The
+# first N_DYNAMIC_BLOCKS types are integrated every step, so the dynamic
+# entities form a single block at the front of the arrays.
+ROW_BLOCK_ORDER: tuple[EntityType, ...] = (
+    EntityType.BALL,
+    EntityType.RECTANGLE_OBSTACLE,
+    EntityType.CIRCLE_OBSTACLE,
+)
+N_DYNAMIC_BLOCKS: int = 1
+ROW_BLOCK_INDEX: dict[EntityType, int] = {
+    etype: block for block, etype in enumerate(ROW_BLOCK_ORDER)
+}
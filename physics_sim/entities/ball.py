@@ -13,6 +13,15 @@ class Ball(PhysicalEntity):
     radius, mass, and visual properties.
     """
 
+    __slots__ = (
+        "_radius",
+        "color",
+        "restitution",
+        "_drag_coefficient",
+        "_cross_sectional_area",
+        "_friction_coefficient",
+    )
+
     def __init__(
         self,
         position: np.ndarray,
@@ -22,7 +31,7 @@ class Ball(PhysicalEntity):
         color: tuple[int, int, int] = (255, 0, 0),
         restitution: float = 1.0,
         drag_coefficient: float = 0.47,
-        entity_id: str | None = None,
+        entity_id: int | None = None,
         friction_coefficient: float = 0.5,
     ):
         """
@@ -41,7 +50,6 @@ class Ball(PhysicalEntity):
         self.color = color
         self.restitution = restitution
         self._drag_coefficient = drag_coefficient
-        self._acceleration = np.array([0.0, 0.0])
         self._cross_sectional_area = self._calcualate_cross_sectional_area()
         self._friction_coefficient = friction_coefficient
 
@@ -11,13 +11,22 @@ class RectangleObstacle(Entity):
     Represents an immovable rectangular object in the simulation.
     """
 
+    __slots__ = (
+        "position",
+        "width",
+        "height",
+        "color",
+        "static",
+        "_friction_coefficient",
+    )
+
     def __init__(
         self,
         position: np.ndarray | Any,
         width: float,
         height: float,
         color: tuple[int, int, int] = (100, 100, 100),
-        entity_id: str | None = None,
+        entity_id: int | None = None,
         friction_coefficient: float = 0.2,
     ):
         """
@@ -154,12 +163,14 @@ class CircleObstacle(Entity):
     Represents an immovable circular object in the simulation.
     """
 
+    __slots__ = ("position", "radius", "color", "static", "_friction_coefficient")
+
     def __init__(
         self,
         position: np.ndarray | Any,
         radius: float,
         color: tuple[int, int, int] = (100, 100, 100),
-        entity_id: str | None = None,
+        entity_id: int | None = None,
         friction_coefficient: float = 0.2,
     ):
         """
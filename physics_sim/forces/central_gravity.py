@@ -30,24 +30,25 @@ class CentralGravityForce(Force):
         dt: float,
         **kwargs,
     ) -> np.ndarray:
-        deltas = self.center - positions
-        r2 = np.sum(deltas**2, axis=1, keepdims=True)
-        r2 = np.maximum(r2, 1e-10)
-        r = np.sqrt(r2)
-        directions = deltas / r
-        magnitudes = self.G * self.center_mass * masses[:, np.newaxis] / r2
-        return directions * magnitudes
+        out = self._output_buffer(len(positions))
+        np.subtract(self.center, positions, out=out)
+        r2 = np.einsum("ij,ij->i", out, out)
+        np.maximum(r2, 1e-10, out=r2)
+        # Unit direction times G*M*m / r^2, scaled in place
+        out /= np.sqrt(r2)[:, np.newaxis]
+        magnitudes = masses / r2
+        magnitudes *= self.G * self.center_mass
+        out *= magnitudes[:, np.newaxis]
+        return out
 
-    def get_potential_energy_contribution(
-        self,
-        positions: np.ndarray,
-        masses: np.ndarray,
-        **kwargs,
-    ) -> float:
+    def potential_energy_per_entity(
+        self, positions: np.ndarray, masses: np.ndarray
+    ) -> np.ndarray:
+        # U = -G * M * m / r
         deltas = self.center - positions
-        r = np.linalg.norm(deltas, axis=1)
+        r = np.sqrt(np.einsum("ij,ij->i", deltas, deltas))
         r = np.maximum(r, 1e-10)
-        return float(-self.G * self.center_mass * np.sum(masses / r))
+        return (-self.G * self.center_mass) * masses / r
 
     @classmethod
     def is_unique(cls) -> bool:
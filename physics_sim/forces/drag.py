@@ -6,7 +6,11 @@ from typing import Any
 
 import numpy as np
 
-from physics_sim.core import Entity, Force, PhysicalEntity
+from physics_sim.core import Force
+from physics_sim.core._dtypes import STATE_DTYPE
+from physics_sim.core._jit import NUMBA_AVAILABLE
+
+from . import _kernels
 
 
 class DragForce(Force):
@@ -35,47 +39,6 @@ class DragForce(Force):
     def get_name(cls) -> str:
         return "Drag"
 
-    def apply_to(self, entity: Entity, dt: float) -> np.ndarray:
-        """Calculate drag force based on velocity."""
-        if not isinstance(entity, PhysicalEntity):
-            return np.array([0.0, 0.0])
-
-        velocity = entity.velocity
-        if isinstance(velocity, np.ndarray):
-            speed = np.linalg.norm(velocity)
-        else:
-            speed = velocity.magnitude()
-
-        if speed < 0.001:  # Avoid division by zero
-            return np.array([0.0, 0.0])
-
-        # Get entity-specific properties
-        drag_coef = entity.drag_coefficient  # C_D (0.47 for sphere)
-        cross_section = entity.cross_sectional_area
-
-        if self.linear:
-            # Simplified linear drag: F = -k * v
-            # Using C_D * A as combined coefficient
-            k = drag_coef * cross_section
-            if isinstance(velocity, np.ndarray):
-                return velocity * (-k)
-            else:
-                v_array = np.array([velocity.x, velocity.y])
-                return v_array * (-k)
-        else:
-            # Full quadratic drag equation: F = -(1/2) * ρ * v² * C_D * A * (v/|v|)
-            # Direction: opposite to velocity (v/|v|)
-            # Magnitude: (1/2) * ρ * v² * C_D * A
-            drag_magnitude = (
-                0.5 * self.fluid_density * (speed**2) * drag_coef * cross_section
-            )
-            if isinstance(velocity, np.ndarray):
-                drag_direction = velocity / speed
-            else:
-                drag_direction = velocity.normalized()
-                drag_direction = np.array([drag_direction.x, drag_direction.y])
-            return drag_direction * (-drag_magnitude)
-
     def apply_force(
         self,
         positions: np.ndarray,
@@ -89,19 +52,49 @@ class DragForce(Force):
 
         Args:
             velocities: Velocity vectors, shape (n, 2)
-            kwargs: Must include 'drag_coeffs' and 'cross_sections' arrays
+            kwargs: Must include 'drag_coeffs' and 'cross_sections' arrays;
+                an optional boolean 'drag_mask' limits drag to the set rows
 
         Returns:
             Force vectors, shape (n, 2)
         """
-        drag_coeffs = kwargs.get("drag_coeffs", np.ones(len(velocities)))
-        cross_sections = kwargs.get("cross_sections", np.ones(len(velocities)))
-
-        speeds = np.linalg.norm(velocities, axis=1, keepdims=True)
+        drag_coeffs = kwargs.get("drag_coeffs", np.ones(len(velocities), STATE_DTYPE))
+        cross_sections = kwargs.get(
+            "cross_sections", np.ones(len(velocities), STATE_DTYPE)
+        )
+        drag_mask = kwargs.get("drag_mask")
+        if drag_mask is None:
+            drag_mask = np.ones(len(velocities), dtype=bool)
+
+        out = self._output_buffer(len(velocities))
+        if NUMBA_AVAILABLE:
+            # The kernels are compiled for float32 only; engine state already
+            # is, so these are no-op views there
+            velocities = np.asarray(velocities, dtype=STATE_DTYPE)
+            drag_coeffs = np.asarray(drag_coeffs, dtype=STATE_DTYPE)
+            cross_sections = np.asarray(cross_sections, dtype=STATE_DTYPE)
+            drag_mask = np.asarray(drag_mask, dtype=bool)
+            if self.linear:
+                _kernels.linear_drag(
+                    out, velocities, drag_coeffs, cross_sections, drag_mask
+                )
+            else:
+                _kernels.quadratic_drag(
+                    out,
+                    velocities,
+                    drag_coeffs,
+                    cross_sections,
+                    drag_mask,
+                    float(self.fluid_density),
+                )
+            return out
+
+        speeds = np.sqrt(np.einsum("ij,ij->i", velocities, velocities))[:, np.newaxis]
 
         # Avoid division by zero
-        mask = speeds[:, 0] > 0.001
-        result = np.zeros_like(velocities)
+        mask = (speeds[:, 0] > 0.001) & drag_mask
+        result = out
+        result.fill(0.0)
 
         if mask.sum() == 0:
             return result
@@ -40,20 +40,23 @@ class ExplosionImpulseForce(Force):
         # Simple time-boxed impulse distributed as force over this frame
         if dt > 0:
             self._time += dt
+        out = self._output_buffer(len(positions))
         if self._time > self.duration:
-            return np.zeros_like(positions)
+            out.fill(0.0)
+            return out
 
-        deltas = positions - self.center
-        r2 = np.sum(deltas**2, axis=1, keepdims=True)
-        r = np.sqrt(np.maximum(r2, 1e-10))
-        dirs = deltas / r
+        np.subtract(positions, self.center, out=out)
+        r2 = np.einsum("ij,ij->i", out, out)
+        r = np.sqrt(np.maximum(r2, 1e-10, out=r2), out=r2)
+        out /= r[:, np.newaxis]
 
         # Temporal envelope (e.g., triangular decay)
         t_norm = max(0.0, 1.0 - self._time / self.duration)
         impulse_mag = self.peak_impulse * t_norm
         # Convert impulse to force over dt; add radial falloff
         magnitude = (impulse_mag / max(dt, 1e-6)) / (r**self.falloff)
-        return dirs * magnitude
+        out *= magnitude[:, np.newaxis]
+        return out
 
     def get_render_data(self, sample_points: np.ndarray) -> dict[str, Any]:
         t_norm = max(0.0, 1.0 - self._time / self.duration)
@@ -3,6 +3,10 @@ from typing import Any
 import numpy as np
 
 from physics_sim.core import Force
+from physics_sim.core._dtypes import STATE_DTYPE
+from physics_sim.core._jit import NUMBA_AVAILABLE
+
+from . import _kernels
 
 
 class LinearGravityForce(Force):
@@ -11,6 +15,8 @@ class LinearGravityForce(Force):
     Applies to all PhysicalEntity instances.
     """
 
+    is_constant_accel = True
+
     def __init__(self, acceleration: np.ndarray | None = None):
         """
         Args:
@@ -44,17 +50,27 @@ class LinearGravityForce(Force):
         Returns:
             Force vectors, shape (n, 2)
         """
+        if NUMBA_AVAILABLE:
+            out = self._output_buffer(len(masses))
+            # The kernel is compiled for float32 masses only
+            _kernels.linear_gravity(
+                out,
+                np.asarray(masses, dtype=STATE_DTYPE),
+                float(self.acceleration[0]),
+                float(self.acceleration[1]),
+            )
+            return out
         # F = m * g, broadcast gravity vector to all masses
         # masses[:, np.newaxis] creates shape (n, 1) for broadcasting
         return self.acceleration * masses[:, np.newaxis]
 
-    def get_potential_energy_contribution(
-        self,
-        positions: np.ndarray,
-        masses: np.ndarray,
-        **kwargs,
-    ) -> float:
-        """Calculate gravitational potential energy.
+    def constant_accel_value(self) -> np.ndarray:
+        return self.acceleration
+
+    def potential_energy_per_entity(
+        self, positions: np.ndarray, masses: np.ndarray
+    ) -> np.ndarray:
+        """Calculate gravitational potential energy of each entity.
 
         PE = sum(m * g * h) where h is height from reference (y=0).
         For downward gravity (g_y < 0), higher positions have more PE.
@@ -64,7 +80,7 @@ class LinearGravityForce(Force):
             masses: Mass values, shape (n,)
 
         Returns:
-            Total potential energy in Joules
+            Potential energies in Joules, shape (n,)
         """
         # PE = m * g * h, where h is the y-coordinate (height)
         # acceleration is the gravity vector [g_x, g_y]
@@ -72,7 +88,7 @@ class LinearGravityForce(Force):
         # which gives positive PE for positive heights
         heights = positions[:, 1]  # y-coordinates
         g_magnitude = -self.acceleration[1]  # Negate to get positive for upward
-        return float(np.sum(masses * g_magnitude * heights))
+        return masses * g_magnitude * heights
 
     @classmethod
     def is_unique(cls) -> bool:
@@ -34,7 +34,9 @@ class PairwiseDistancePBDFore(Force):
         **kwargs,
     ) -> np.ndarray:
         # Force-less; constraint handled in apply_constraints
-        return np.zeros_like(positions)
+        out = self._output_buffer(len(positions))
+        out.fill(0.0)
+        return out
 
     def apply_constraints(
         self,
@@ -52,7 +54,9 @@ class PairwiseDistancePBDFore(Force):
         # Compute pairwise distances (O(n^2)) and nearest neighbor within max_distance
         # For moderate n typical in UI, acceptable. Could be optimized later.
         diffs = positions[:, None, :] - positions[None, :, :]
-        dists = np.linalg.norm(diffs, axis=2) + np.eye(n) * 1e9
+        dists = np.sqrt(np.einsum("ijk,ijk->ij", diffs, diffs))
+        # Keep each ball from picking itself as its nearest neighbour
+        np.fill_diagonal(dists, 1e9)
 
         nearest_idx = np.argmin(dists, axis=1)
         nearest_dist = dists[np.arange(n), nearest_idx]
@@ -3,6 +3,10 @@ from typing import Any
 import numpy as np
 
 from physics_sim.core import Force
+from physics_sim.core._dtypes import STATE_DTYPE
+from physics_sim.core._jit import NUMBA_AVAILABLE
+
+from . import _kernels
 
 
 class SpringTetherPBDFore(Force):
@@ -34,9 +38,27 @@ class SpringTetherPBDFore(Force):
         dt: float,
         **kwargs,
     ) -> np.ndarray:
+        if NUMBA_AVAILABLE:
+            out = self._output_buffer(len(positions))
+            # The kernel is compiled for float32 positions only
+            _kernels.spring_tether(
+                out,
+                np.asarray(positions, dtype=STATE_DTYPE),
+                float(self.center[0]),
+                float(self.center[1]),
+                self.k,
+            )
+            return out
         deltas = positions - self.center
         return -self.k * deltas
 
+    def potential_energy_per_entity(
+        self, positions: np.ndarray, masses: np.ndarray
+    ) -> np.ndarray:
+        # Potential of the Hooke force above: U = 1/2 * k * |p - c|^2
+        deltas = positions - self.center
+        return 0.5 * self.k * np.einsum("ij,ij->i", deltas, deltas)
+
     def apply_constraints(
         self,
         positions: np.ndarray,
@@ -46,8 +68,10 @@ class SpringTetherPBDFore(Force):
         dt: float,
         **kwargs,
     ) -> np.ndarray:
-        deltas = positions - self.center
-        dist = np.linalg.norm(deltas, axis=1, keepdims=True)
+        # Cast the center, not the batch, so the projection stays in the
+        # positions' precision
+        deltas = positions - self.center.astype(positions.dtype)
+        dist = np.sqrt(np.einsum("ij,ij->i", deltas, deltas))[:, np.newaxis]
         safe = np.maximum(dist, 1e-10)
         dirs = deltas / safe
         corr = self.rest_length - dist
@@ -34,15 +34,17 @@ class VortexForce(Force):
         dt: float,
         **kwargs,
     ) -> np.ndarray:
-        deltas = positions - self.center
-        r2 = np.sum(deltas**2, axis=1, keepdims=True)
-        r = np.sqrt(np.maximum(r2, 1e-10))
         # Perpendicular (tangential) directions: rotate by +90deg
-        tangents = np.concatenate((-deltas[:, 1:2], deltas[:, 0:1]), axis=1)
-        tangents /= np.maximum(np.linalg.norm(tangents, axis=1, keepdims=True), 1e-10)
+        out = self._output_buffer(len(positions))
+        np.subtract(self.center[1], positions[:, 1], out=out[:, 0])
+        np.subtract(positions[:, 0], self.center[0], out=out[:, 1])
+        r2 = np.einsum("ij,ij->i", out, out)
+        out /= np.maximum(np.sqrt(r2), 1e-10)[:, np.newaxis]
 
-        magnitude = self.strength / (r**self.falloff)
-        return tangents * magnitude
+        np.maximum(r2, 1e-10, out=r2)
+        magnitude = self.strength / np.sqrt(r2) ** self.falloff
+        out *= magnitude[:, np.newaxis]
+        return out
 
     def get_render_data(self, sample_points: np.ndarray) -> dict[str, Any]:
         overlays = [
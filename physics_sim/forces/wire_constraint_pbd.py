@@ -22,6 +22,20 @@ class WireConstraintPBDForce(Force):
     def get_name(cls) -> str:
         return "WireConstraintPBD"
 
+    def apply_force(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        masses: np.ndarray,
+        entity_types: np.ndarray,
+        dt: float,
+        **kwargs,
+    ) -> np.ndarray:
+        """No force; the wire acts only through apply_constraints."""
+        out = self._output_buffer(len(positions))
+        out.fill(0.0)
+        return out
+
     def apply_constraints(
         self,
         positions: np.ndarray,
@@ -32,8 +46,10 @@ class WireConstraintPBDForce(Force):
         **kwargs,
     ) -> tuple[np.ndarray, np.ndarray]:
         """Project positions onto circle of fixed radius."""
-        deltas = positions - self.center
-        dist = np.linalg.norm(deltas, axis=1, keepdims=True)
+        # Cast the center, not the batch, so the projection stays in the
+        # positions' precision
+        deltas = positions - self.center.astype(positions.dtype)
+        dist = np.sqrt(np.einsum("ij,ij->i", deltas, deltas))[:, np.newaxis]
         safe = np.maximum(dist, 1e-10)
         dirs = deltas / safe
         corr = self.radius - dist
@@ -1,4 +1,5 @@
 import math
+from array import array
 from typing import Any
 
 import arcade
@@ -15,6 +16,12 @@ ARROW_HEAD_MAX_PX: float = 28.0
 ARROW_HEAD_WIDTH_RATIO: float = 0.8  # head width relative to head length
 
 
+def _interleave(points: np.ndarray, colors: np.ndarray) -> array:
+    """Pack (n, 2) points and (n, 4) colors into a [x,y,r,g,b,a] float array."""
+    data = np.hstack((points, colors)).astype(np.float32)
+    return array("f", data.tobytes())
+
+
 class ForcesRendererMixin:
     """Mixin to render forces as a vector field and overlays."""
 
@@ -42,63 +49,48 @@ class ForcesRendererMixin:
             return
         # Scale vectors to a reasonable on-screen length
         max_len = VECTOR_MAX_LENGTH_RATIO * spacing
-        mags = np.linalg.norm(vectors, axis=1)
-        if np.all(mags == 0):
+        mags = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+        # Magnitudes are non-negative, so the max doubles as the all-zero check
+        max_mag = float(mags.max())
+        if max_mag == 0.0:
             return
-        max_mag = float(np.max(mags))
         scale = max_len / (max_mag + 1e-9)
 
-        def _lerp_color(
-            c0: tuple[int, int, int], c1: tuple[int, int, int], t: float
-        ) -> tuple[int, int, int]:
-            t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
-            r = int(round(c0[0] + (c1[0] - c0[0]) * t))
-            g = int(round(c0[1] + (c1[1] - c0[1]) * t))
-            b = int(round(c0[2] + (c1[2] - c0[2]) * t))
-            return (r, g, b)
-
-        # Build unified shafts (GL_LINES, width=1) to enable buffer updates
-        line_points: list[tuple[float, float]] = []
-        line_colors: list[tuple[int, int, int, int]] = []
-
-        tri_points: list[tuple[float, float]] = []
-        tri_colors: list[tuple[int, int, int, int]] = []
-
-        for (px, py), vec, mag in zip(sample_points, vectors, mags):
-            strength = float(mag / (max_mag + 1e-9))
-            r, g, b = _lerp_color(VECTOR_COLOR_LOW, VECTOR_COLOR_HIGH, strength)
-            col = (r, g, b, 255)
+        # Per-vector colors, interpolated from low to high strength
+        strength = np.clip(mags / (max_mag + 1e-9), 0.0, 1.0)[:, np.newaxis]
+        color_low = np.array(VECTOR_COLOR_LOW, dtype=np.float64)
+        color_high = np.array(VECTOR_COLOR_HIGH, dtype=np.float64)
+        rgba = np.full((len(mags), 4), 255.0)
+        rgba[:, :3] = np.rint(color_low + (color_high - color_low) * strength)
 
-            sx = self.physics_to_screen_x(float(px))
-            sy = self.physics_to_screen_y(float(py))
-            ex = self.physics_to_screen_x(float(px + vec[0] * scale))
-            ey = self.physics_to_screen_y(float(py + vec[1] * scale))
+        # Shaft endpoints in screen space, one batched transform each
+        starts = self.physics_to_screen(sample_points)
+        ends = self.physics_to_screen(sample_points + vectors * scale)
 
-            line_points.extend([(sx, sy), (ex, ey)])
-            line_colors.extend([col, col])
+        # Build unified shafts (GL_LINES, width=1) to enable buffer updates
+        line_xy = np.stack((starts, ends), axis=1).reshape(-1, 2)
+        line_rgba = np.repeat(rgba, 2, axis=0)
+
+        # Arrowheads for shafts that are long enough to have a direction
+        deltas = ends - starts
+        seg_len = np.hypot(deltas[:, 0], deltas[:, 1])
+        has_head = seg_len > 1e-6
+        tips = ends[has_head]
+        seg_len = seg_len[has_head]
+        units = deltas[has_head] / seg_len[:, np.newaxis]
+        head_len = np.clip(seg_len * 0.35, ARROW_HEAD_MIN_PX, ARROW_HEAD_MAX_PX)
+        half_w = (head_len * ARROW_HEAD_WIDTH_RATIO * 0.5)[:, np.newaxis]
+        bases = tips - units * head_len[:, np.newaxis]
+        offsets = np.column_stack((-units[:, 1], units[:, 0])) * half_w
+        tri_xy = np.stack((tips, bases + offsets, bases - offsets), axis=1).reshape(
+            -1, 2
+        )
+        tri_rgba = np.repeat(rgba[has_head], 3, axis=0)
 
-            dx = ex - sx
-            dy = ey - sy
-            seg_len = math.hypot(dx, dy)
-            if seg_len <= 1e-6:
-                continue
-            head_len = max(
-                ARROW_HEAD_MIN_PX,
-                min(ARROW_HEAD_MAX_PX, seg_len * 0.35),
-            )
-            head_w = head_len * ARROW_HEAD_WIDTH_RATIO
-            ux = dx / seg_len
-            uy = dy / seg_len
-            bx = ex - ux * head_len
-            by = ey - uy * head_len
-            px_off = -uy * (head_w * 0.5)
-            py_off = ux * (head_w * 0.5)
-            x1 = bx + px_off
-            y1 = by + py_off
-            x2 = bx - px_off
-            y2 = by - py_off
-            tri_points.extend([(ex, ey), (x1, y1), (x2, y2)])
-            tri_colors.extend([col, col, col])
+        line_points = [tuple(p) for p in line_xy.tolist()]
+        line_colors = [tuple(c) for c in line_rgba.astype(int).tolist()]
+        tri_points = [tuple(p) for p in tri_xy.tolist()]
+        tri_colors = [tuple(c) for c in tri_rgba.astype(int).tolist()]
 
         # Cache key based on number of vertices (stable if viewport/grid stable)
         key = (len(line_points), len(tri_points))
@@ -121,20 +113,8 @@ class ForcesRendererMixin:
         else:
             # Update buffers in-place to avoid allocations
             if self._vf_shape_lines is not None:
-                # Build interleaved float array [x,y,r,g,b,a] * N
-                data_lines = []
-                for (x, y), (cr, cg, cb, ca) in zip(line_points, line_colors):
-                    data_lines.extend([
-                        float(x),
-                        float(y),
-                        float(cr),
-                        float(cg),
-                        float(cb),
-                        float(ca),
-                    ])
-                from array import array as _array
-
-                self._vf_shape_lines.data = _array("f", data_lines)
+                # Interleaved float array [x,y,r,g,b,a] * N
+                self._vf_shape_lines.data = _interleave(line_xy, line_rgba)
                 if self._vf_shape_lines.geometry is None:
                     # First draw will create buffer with new data
                     pass
@@ -142,19 +122,7 @@ class ForcesRendererMixin:
                     self._vf_shape_lines.buffer.write(self._vf_shape_lines.data)
 
             if self._vf_shape_tris is not None:
-                data_tris = []
-                for (x, y), (cr, cg, cb, ca) in zip(tri_points, tri_colors):
-                    data_tris.extend([
-                        float(x),
-                        float(y),
-                        float(cr),
-                        float(cg),
-                        float(cb),
-                        float(ca),
-                    ])
-                from array import array as _array
-
-                self._vf_shape_tris.data = _array("f", data_tris)
+                self._vf_shape_tris.data = _interleave(tri_xy, tri_rgba)
                 if self._vf_shape_tris.geometry is None:
                     pass
                 else:
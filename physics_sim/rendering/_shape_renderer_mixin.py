@@ -1,19 +1,18 @@
+from collections.abc import Callable
+
 import arcade
 
 
 class ShapeRendererMixin:
     """Mixin for rendering different entity shapes (circles, rectangles, etc.)."""
 
-    def _render_entity(self, render_data: dict) -> None:
-        """Render a single entity based on its render data."""
-        render_type = render_data.get("render_type", render_data.get("type"))
-
-        if render_type == "circle":
-            self._render_circle(render_data)
-        elif render_type == "circle_static":
-            self._render_circle_static(render_data)
-        elif render_type == "rectangle":
-            self._render_rectangle(render_data)
+    def _entity_renderers(self) -> dict[str, Callable[[dict], None]]:
+        """Bound render method per render type, resolved once per batch."""
+        return {
+            "circle": self._render_circle,
+            "circle_static": self._render_circle_static,
+            "rectangle": self._render_rectangle,
+        }
 
     def _render_circle(self, data: dict) -> None:
         """Render a circle entity."""
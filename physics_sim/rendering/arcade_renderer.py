@@ -1,4 +1,5 @@
 import arcade
+import numpy as np
 
 from physics_sim.core import LayoutRegion, Renderer
 
@@ -58,6 +59,16 @@ class ArcadeRenderer(
         """Convert screen Y coordinate to physics coordinate."""
         return (y - self.region.bottom) / self.scale
 
+    def physics_to_screen(self, points: np.ndarray) -> np.ndarray:
+        """Convert (n, 2) physics points to screen coordinates in one call."""
+        origin = np.array((self.region.left, self.region.bottom), dtype=np.float64)
+        return np.asarray(points, dtype=np.float64) * self.scale + origin
+
+    def screen_to_physics(self, points: np.ndarray) -> np.ndarray:
+        """Convert (n, 2) screen points to physics coordinates in one call."""
+        origin = np.array((self.region.left, self.region.bottom), dtype=np.float64)
+        return (np.asarray(points, dtype=np.float64) - origin) / self.scale
+
     def clear(self) -> None:
         """Clear the screen."""
         arcade.start_render()
@@ -65,8 +76,12 @@ class ArcadeRenderer(
 
     def render_entities(self, render_data: list[dict]) -> None:
         """Render entities from data dicts (not entity objects)."""
+        # Resolve the bound draw methods once instead of per entity
+        renderers_get = self._entity_renderers().get
         for data in render_data:
-            self._render_entity(data)
+            renderer = renderers_get(data.get("render_type", data.get("type")))
+            if renderer is not None:
+                renderer(data)
 
     def render_ui(self, ui_elements: list) -> None:
         """Render UI elements (panels, buttons, etc.)."""
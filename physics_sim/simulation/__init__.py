@@ -1,4 +1,15 @@
 __all__: list[str] = ["SimulationConfig", "Simulator"]
 
+import importlib
+from typing import Any
+
 from physics_sim.simulation.config import SimulationConfig
-from physics_sim.simulation.simulator import Simulator
+
+
+def __getattr__(name: str) -> Any:
+    # Simulator pulls in arcade; only import it when actually requested
+    if name == "Simulator":
+        value = importlib.import_module("physics_sim.simulation.simulator").Simulator
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -131,7 +131,9 @@ class Simulator(arcade.Window):
         # Load available entity types from engine
         entity_types = self.engine.get_supported_entity_types()
         logger.info(
-            f"Loaded {len(entity_types)} entity types: {[t.__name__ for t in entity_types]}"
+            "Loaded %s entity types: %s",
+            len(entity_types),
+            [t.__name__ for t in entity_types],
         )
         self.control_section.placement_controls.set_available_entity_types(entity_types)
 
@@ -140,7 +142,7 @@ class Simulator(arcade.Window):
         # Update force manager with currently active forces
         active_forces = self.engine.get_forces()
         logger.info(
-            f"Active forces in engine: {[type(f).__name__ for f in active_forces]}"
+            "Active forces in engine: %s", [type(f).__name__ for f in active_forces]
         )
         self.force_manager_section.update_active_forces(active_forces)
 
@@ -216,8 +218,9 @@ class Simulator(arcade.Window):
 
         # Render viewport entities using data from engine
         render_data = self.engine.get_render_data()
-        if self.viewport_section.renderer.show_forces and self._forces_render_cache:
-            self.viewport_section.renderer.render_forces_data(self._forces_render_cache)
+        renderer = self.viewport_section.renderer
+        if renderer.show_forces and self._forces_render_cache:
+            renderer.render_forces_data(self._forces_render_cache)
         self.viewport_section.render_with_data(render_data)
 
         # Update debug info in status display
@@ -234,7 +237,7 @@ class Simulator(arcade.Window):
             key: Key code that was pressed
             modifiers: Bitwise AND of modifier keys (shift, ctrl, etc.)
         """
-        logger.debug(f"Key pressed: {key} (modifiers: {modifiers})")
+        logger.debug("Key pressed: %s (modifiers: %s)", key, modifiers)
 
         # Toggle grid with G
         if key == arcade.key.G:
@@ -255,7 +258,7 @@ class Simulator(arcade.Window):
         # Toggle add mode with A
         elif key == arcade.key.A:
             self.add_mode = not self.add_mode
-            logger.info(f"Add mode toggled: {self.add_mode}")
+            logger.info("Add mode toggled: %s", self.add_mode)
             self.control_section.placement_controls.set_add_mode(self.add_mode)
             self.control_section.update_status()
 
@@ -283,7 +286,7 @@ class Simulator(arcade.Window):
             button: Mouse button that was clicked
             modifiers: Bitwise AND of modifier keys
         """
-        logger.debug(f"Mouse click: button={button}, screen=({x:.1f}, {y:.1f})")
+        logger.debug("Mouse click: button=%s, screen=(%.1f, %.1f)", button, x, y)
 
         if button == arcade.MOUSE_BUTTON_LEFT:
             # Convert screen coordinates to physics coordinates
@@ -292,9 +295,9 @@ class Simulator(arcade.Window):
             phys_y = renderer.screen_to_physics_y(y)
             click_pos = np.array([phys_x, phys_y])
 
-            logger.debug(f"Physics coords: ({phys_x:.2f}, {phys_y:.2f})")
+            logger.debug("Physics coords: (%.2f, %.2f)", phys_x, phys_y)
             logger.debug(
-                f"Add mode: {self.add_mode}, Paused: {self.engine.is_paused()}"
+                "Add mode: %s, Paused: %s", self.add_mode, self.engine.is_paused()
             )
 
             # In add mode: create new entity (takes priority)
@@ -302,7 +305,7 @@ class Simulator(arcade.Window):
                 entity_class = (
                     self.control_section.placement_controls.get_selected_entity_type()
                 )
-                logger.info(f"Add mode active, selected entity type: {entity_class}")
+                logger.info("Add mode active, selected entity type: %s", entity_class)
                 if entity_class:
                     try:
                         # Get fully constructed entity from editor
@@ -314,12 +317,15 @@ class Simulator(arcade.Window):
                             # Add to engine
                             self.engine.add_entity(entity)
                             logger.info(
-                                f"Created {entity_class.__name__} at ({phys_x:.2f}, {phys_y:.2f})"
+                                "Created %s at (%.2f, %.2f)",
+                                entity_class.__name__,
+                                phys_x,
+                                phys_y,
                             )
                         else:
                             logger.error("Failed to create entity from editor")
                     except Exception as e:
-                        logger.error(f"Failed to create entity: {e}")
+                        logger.error("Failed to create entity: %s", e)
                 else:
                     logger.warning("Add mode active but no entity type selected")
                 return
@@ -334,7 +340,7 @@ class Simulator(arcade.Window):
                     entity = self.engine.get_entity_for_editing(selected_id)
                     if entity:
                         entity_type = entity.__class__.__name__
-                        logger.info(f"Entity selected: {entity_type}")
+                        logger.info("Entity selected: %s", entity_type)
                         # Load entity into editor for editing
                         self.control_section.entity_editor.set_entity_instance(entity)
                 else:
@@ -357,7 +363,9 @@ class Simulator(arcade.Window):
     def add_entity(self, entity):
         """Convenience method to add entity to physics engine."""
         logger.info(
-            f"Adding entity: {entity.__class__.__name__} at position {entity.position}"
+            "Adding entity: %s at position %s",
+            entity.__class__.__name__,
+            entity.position,
         )
         self.engine.add_entity(entity)
 
@@ -372,7 +380,7 @@ class Simulator(arcade.Window):
             enabled: Whether add mode is enabled
         """
         self.add_mode = enabled
-        logger.info(f"Add mode: {enabled}")
+        logger.info("Add mode: %s", enabled)
 
         if enabled:
             # Show entity editor in add mode
@@ -391,7 +399,7 @@ class Simulator(arcade.Window):
         Args:
             entity_class: Selected entity class
         """
-        logger.info(f"Entity type changed to: {entity_class.__name__}")
+        logger.info("Entity type changed to: %s", entity_class.__name__)
 
         # Update entity editor if in add mode
         if self.add_mode:
@@ -424,7 +432,7 @@ class Simulator(arcade.Window):
         if entity_id:
             entity = self.engine.get_entity_for_editing(entity_id)
             if entity:
-                logger.info(f"Loading entity for editing: {entity.__class__.__name__}")
+                logger.info("Loading entity for editing: %s", entity.__class__.__name__)
                 self.control_section.entity_editor.set_entity_instance(entity)
 
     def _on_entity_editor_save(self, params: dict):
@@ -442,11 +450,11 @@ class Simulator(arcade.Window):
                 # Update arrays in engine from modified entity object
                 success = self.engine.update_entity_from_object(entity)
                 if success:
-                    logger.info(f"Entity updated: {entity.__class__.__name__}")
+                    logger.info("Entity updated: %s", entity.__class__.__name__)
                 else:
                     logger.error("Failed to update entity in engine")
             except Exception as e:
-                logger.error(f"Failed to update entity: {e}")
+                logger.error("Failed to update entity: %s", e)
 
     def _on_entity_editor_delete(self, entity_id):
         """Handle save from entity editor panel.
@@ -454,12 +462,12 @@ class Simulator(arcade.Window):
         Args:
             params: Dictionary of updated entity parameters
         """
-        logger.info(f"Delete entity {entity_id} from engine")
+        logger.info("Delete entity %s from engine", entity_id)
         if entity_id:
             try:
                 self.engine.remove_entity(entity_id)
             except Exception as e:
-                logger.error(f"Failed to remove entity: {e}")
+                logger.error("Failed to remove entity: %s", e)
 
     def _on_force_toggle(self, force_class: type, enabled: bool):
         """Handle force activation/deactivation.
@@ -469,20 +477,23 @@ class Simulator(arcade.Window):
             enabled: True to enable, False to disable
         """
         force_name = force_class.__name__
-        logger.info(f"Force toggle: {force_name} -> {enabled}")
+        logger.info("Force toggle: %s -> %s", force_name, enabled)
 
         if enabled:
             # Create force instance with default parameters
             force_instance = force_class()
-            self.engine.add_force(force_instance)
-            logger.info(f"Added force: {force_name}")
+            try:
+                self.engine.add_force(force_instance)
+                logger.info("Added force: %s", force_name)
+            except ValueError as e:
+                logger.warning("Force not added: %s", e)
         else:
             # Find and remove force instance
             active_forces = self.engine.get_forces()
             for force in active_forces:
                 if type(force).__name__ == force_name:
                     self.engine.remove_force(force)
-                    logger.info(f"Removed force: {force_name}")
+                    logger.info("Removed force: %s", force_name)
                     break
 
         # Update force manager display
@@ -497,13 +508,13 @@ class Simulator(arcade.Window):
             params: Dictionary of parameter values
         """
         force_name = type(force_instance).__name__
-        logger.info(f"Updating force parameters: {force_name}")
+        logger.info("Updating force parameters: %s", force_name)
 
         success = force_instance.update_parameters(params)
         if success:
-            logger.info(f"Force parameters updated: {force_name}")
+            logger.info("Force parameters updated: %s", force_name)
         else:
-            logger.error(f"Failed to update force parameters: {force_name}")
+            logger.error("Failed to update force parameters: %s", force_name)
 
         # Refresh force manager display
         active_forces = self.engine.get_forces()
@@ -6,12 +6,12 @@ class EntitySelector:
 
     def __init__(self):
         """Initialize selector with no selection."""
-        self.selected_entity_id: str | None = None
+        self.selected_entity_id: int | None = None
         self.selection_radius = 1  # Search radius for entity detection
 
     def select_entity(
         self, click_pos: np.ndarray, render_data: list[dict]
-    ) -> str | None:
+    ) -> int | None:
         """Find and select entity ID closest to click position.
 
         Args:
@@ -24,7 +24,7 @@ class ForceManagerSection(BaseSection):
             background_color=arcade.color.LIGHT_SKY_BLUE,
             border_color=arcade.color.GRAY,
         )
-        logger.info(f"ForceManagerSection init: {region}")
+        logger.info("ForceManagerSection init: %s", region)
 
         self.items_per_page = 1
         self.ui_manager = arcade.gui.UIManager()
@@ -355,7 +355,7 @@ class ForceManagerSection(BaseSection):
 
     def set_available_force_types(self, force_types: list[type]):
         """Set available force types to display."""
-        logger.info(f"set_available_force_types: {len(force_types)} types")
+        logger.info("set_available_force_types: %s types", len(force_types))
         self._available_force_types = force_types
         self.total_pages = max(
             1, (len(force_types) + self.items_per_page - 1) // self.items_per_page
@@ -260,7 +260,7 @@ class InventoryPanelSection(BaseSection):
         texts["id_label"].x = x + padding
         texts["id_label"].y = content_y
         texts["id_label"].draw()
-        texts["id_value"].text = f"{data['id'][:10]}"
+        texts["id_value"].text = f"{str(data['id'])[:10]}"
         texts["id_value"].x = x + 60
         texts["id_value"].y = content_y
         texts["id_value"].draw()
@@ -334,7 +334,7 @@ class InventoryPanelSection(BaseSection):
 
         return card_bottom
 
-    def _get_entity_text_objects(self, entity_id: str):
+    def _get_entity_text_objects(self, entity_id: int):
         """Get or create text objects for an entity."""
         if entity_id not in self.entity_text_cache:
             self.entity_text_cache[entity_id] = {
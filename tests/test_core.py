@@ -0,0 +1,107 @@
+"""Tests for the engine-agnostic core: force registration and entities."""
+
+import numpy as np
+import pytest
+
+from physics_sim import Ball, DragForce, LinearGravityForce, NumpyPhysicsEngine
+from physics_sim.core.entity import MAX_TRACKED_FORCES
+from physics_sim.forces import drag
+
+
+def _engine() -> NumpyPhysicsEngine:
+    return NumpyPhysicsEngine(bounds=(20.0, 20.0), track_forces=False)
+
+
+def test_add_force_rejects_a_second_unique_force():
+    engine = _engine()
+    engine.add_force(LinearGravityForce())
+    with pytest.raises(ValueError):
+        engine.add_force(LinearGravityForce())
+    assert len(engine.get_forces()) == 1
+
+
+def test_add_force_twice_is_a_no_op():
+    engine = _engine()
+    gravity = LinearGravityForce()
+    engine.add_force(gravity)
+    engine.add_force(gravity)
+    assert engine.get_forces() == [gravity]
+
+
+def test_add_force_rejects_objects_without_apply_force():
+    engine = _engine()
+    with pytest.raises(TypeError):
+        engine.add_force(object())
+    assert engine.get_forces() == []
+
+
+@pytest.mark.parametrize("use_numba", [True, False], ids=["numba", "numpy"])
+def test_drag_skips_entities_without_drag(use_numba, monkeypatch):
+    """Only balls with a drag coefficient are slowed by drag."""
+    if use_numba:
+        pytest.importorskip("numba")
+    engine = _engine()
+    velocity = np.array([2.0, 1.0])
+    plain = Ball(position=np.array([5.0, 10.0]), velocity=velocity.copy())
+    dragless = Ball(
+        position=np.array([15.0, 10.0]),
+        velocity=velocity.copy(),
+        drag_coefficient=0.0,
+    )
+    engine.add_entity(plain)
+    engine.add_entity(dragless)
+    engine.add_force(DragForce())
+
+    with monkeypatch.context() as patch:
+        patch.setattr(drag, "NUMBA_AVAILABLE", use_numba)
+        engine.step(1.0 / 60.0)
+
+    velocities = engine._velocities
+    plain_row = engine._id_to_index[plain.id]
+    dragless_row = engine._id_to_index[dragless.id]
+    assert np.linalg.norm(velocities[plain_row]) < np.linalg.norm(velocity) - 1e-3
+    # Float32 rounding in the integrator is the only change
+    np.testing.assert_allclose(velocities[dragless_row], velocity, atol=1e-4)
+
+
+@pytest.mark.parametrize("use_numba", [True, False], ids=["numba", "numpy"])
+@pytest.mark.parametrize("linear", [True, False], ids=["linear", "quadratic"])
+def test_drag_mask_zeroes_masked_rows(linear, use_numba, monkeypatch):
+    """Masked rows get no drag even with a drag coefficient and area set."""
+    if use_numba:
+        pytest.importorskip("numba")
+    n = 6
+    velocities = np.full((n, 2), 2.0, dtype=np.float32)
+    coeffs = np.full(n, 0.5, dtype=np.float32)
+    drag_mask = np.arange(n) % 2 == 0
+    with monkeypatch.context() as patch:
+        patch.setattr(drag, "NUMBA_AVAILABLE", use_numba)
+        forces = DragForce(linear=linear).apply_force(
+            velocities,
+            velocities,
+            np.ones(n, dtype=np.float32),
+            np.zeros(n, dtype=np.int32),
+            1.0 / 60.0,
+            drag_coeffs=coeffs,
+            cross_sections=coeffs,
+            drag_mask=drag_mask,
+        )
+    assert np.all(forces[drag_mask] < 0.0)
+    np.testing.assert_array_equal(forces[~drag_mask], 0.0)
+
+
+def test_track_force_keeps_the_most_recent_applications():
+    """Past MAX_TRACKED_FORCES, the oldest applications are overwritten."""
+    ball = Ball(position=np.array([5.0, 5.0]), velocity=np.zeros(2))
+    total = MAX_TRACKED_FORCES + 3
+    for k in range(total):
+        ball.track_force(f"Force{k % 2}", np.array([k, -k]))
+
+    tracked = ball.get_tracked_forces()
+    assert len(tracked) == MAX_TRACKED_FORCES
+    for (name, vector), k in zip(tracked, range(total - MAX_TRACKED_FORCES, total)):
+        assert name == f"Force{k % 2}"
+        np.testing.assert_array_equal(vector, [k, -k])
+
+    ball.clear_force_tracking()
+    assert ball.get_tracked_forces() == []
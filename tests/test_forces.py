@@ -0,0 +1,45 @@
+"""Tests for the batched force implementations."""
+
+import numpy as np
+import pytest
+
+from physics_sim.forces import drag, linear_gravity, spring_tether_pbd
+
+_FORCES = [
+    (drag, lambda: drag.DragForce(linear=True)),
+    (drag, lambda: drag.DragForce(linear=False)),
+    (linear_gravity, linear_gravity.LinearGravityForce),
+    (spring_tether_pbd, spring_tether_pbd.SpringTetherPBDFore),
+]
+
+
+@pytest.mark.parametrize(
+    "module, make_force",
+    _FORCES,
+    ids=["linear-drag", "quadratic-drag", "linear-gravity", "spring-tether"],
+)
+def test_kernels_accept_float64_input(module, make_force, monkeypatch):
+    """Float64 batches reach the float32 kernels and match the NumPy code."""
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    n = 16
+    positions = rng.uniform(0.0, 20.0, (n, 2))
+    velocities = rng.uniform(-3.0, 3.0, (n, 2))
+    masses = rng.uniform(0.5, 3.0, n)
+    entity_types = np.zeros(n, dtype=np.int64)
+    kwargs = {
+        "drag_coeffs": rng.uniform(0.1, 1.0, n),
+        "cross_sections": rng.uniform(0.1, 1.0, n),
+        "drag_mask": np.arange(n) % 3 != 0,
+    }
+
+    results = []
+    for use_numba in (True, False):
+        with monkeypatch.context() as patch:
+            patch.setattr(module, "NUMBA_AVAILABLE", use_numba)
+            forces = make_force().apply_force(
+                positions, velocities, masses, entity_types, 1.0 / 60.0, **kwargs
+            )
+        results.append(np.array(forces, dtype=np.float64))
+
+    np.testing.assert_allclose(results[0], results[1], rtol=1e-5, atol=1e-5)
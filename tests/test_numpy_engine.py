@@ -0,0 +1,323 @@
+"""Tests for the numpy engine's row storage and collision paths."""
+
+import numpy as np
+import pytest
+
+from physics_sim import (
+    Ball,
+    CircleObstacle,
+    LinearGravityForce,
+    NumpyPhysicsEngine,
+    RectangleObstacle,
+)
+from physics_sim.engines.numpy_engine import (
+    boundary_mixin,
+    collision_mixin,
+    integration_mixin,
+)
+from physics_sim.engines.numpy_engine.constants import (
+    GRID_BROADPHASE_THRESHOLD,
+    GRID_BROADPHASE_THRESHOLD_NUMBA,
+)
+from physics_sim.engines.numpy_engine.types import ROW_BLOCK_ORDER, EntityType
+
+# Mixin modules that pick between their Numba kernels and NumPy code
+_KERNEL_SWITCH_MODULES = (boundary_mixin, collision_mixin, integration_mixin)
+
+
+def _make_entity(kind: EntityType, rng: np.random.Generator):
+    position = rng.uniform(1.0, 19.0, 2)
+    if kind == EntityType.BALL:
+        return Ball(
+            position=position,
+            velocity=rng.uniform(-3.0, 3.0, 2),
+            radius=float(rng.uniform(0.2, 0.5)),
+            mass=float(rng.uniform(0.5, 3.0)),
+        )
+    if kind == EntityType.RECTANGLE_OBSTACLE:
+        return RectangleObstacle(
+            position=position,
+            width=float(rng.uniform(0.5, 2.0)),
+            height=float(rng.uniform(0.5, 2.0)),
+        )
+    return CircleObstacle(position=position, radius=float(rng.uniform(0.3, 1.0)))
+
+
+def _assert_row_blocks(engine: NumpyPhysicsEngine, entities: dict) -> None:
+    """Check the per-type row blocks and the id <-> row mapping."""
+    n = engine._n_entities
+    assert engine._block_ends[-1] == n
+    assert engine._n_dynamic == engine._block_range(EntityType.BALL)[1]
+    assert len(engine._id_to_index) == n
+    for etype in ROW_BLOCK_ORDER:
+        start, end = engine._block_range(etype)
+        assert np.all(engine._entity_types[start:end] == etype)
+    for i in range(n):
+        entity_id = int(engine._entity_ids[i])
+        assert engine._id_to_index[entity_id] == i
+        # The row still holds the data of the entity it is mapped to
+        np.testing.assert_allclose(
+            engine._positions[i], entities[entity_id].position, rtol=1e-6
+        )
+
+
+def test_interleaved_add_and_remove_keep_row_blocks():
+    """Adds and removes of mixed types keep every type in its own block."""
+    rng = np.random.default_rng(0)
+    engine = NumpyPhysicsEngine(bounds=(20.0, 20.0))
+    entities = {}
+    kinds = list(EntityType)
+    for step in range(200):
+        if entities and rng.random() < 0.4:
+            entity_id = int(rng.choice(list(entities)))
+            engine.remove_entity(entity_id)
+            del entities[entity_id]
+        else:
+            entity = _make_entity(kinds[step % len(kinds)], rng)
+            engine.add_entity(entity)
+            entities[entity.id] = entity
+        _assert_row_blocks(engine, entities)
+
+    counts = engine.get_entity_counts_by_type()
+    for etype in ROW_BLOCK_ORDER:
+        start, end = engine._block_range(etype)
+        assert counts.get(etype.name, 0) == end - start
+
+
+def test_remove_unknown_id_is_a_no_op():
+    engine = NumpyPhysicsEngine(bounds=(20.0, 20.0))
+    ball = Ball(position=np.array([5.0, 5.0]), velocity=np.zeros(2))
+    engine.add_entity(ball)
+    engine.remove_entity(ball.id + 1000)
+    assert engine._n_entities == 1
+    assert engine._id_to_index[ball.id] == 0
+
+
+def test_inventory_cache_follows_forces_and_tracking():
+    """Force set and tracking changes invalidate the cached inventory."""
+    engine = NumpyPhysicsEngine(bounds=(20.0, 20.0))
+    engine.add_entity(Ball(position=np.array([5.0, 5.0]), velocity=np.zeros(2)))
+    gravity = LinearGravityForce()
+    engine.add_force(gravity)
+    engine.step(1.0 / 60.0)
+    listed = engine.get_inventory_data()
+    assert [f["name"] for f in listed[0]["applied_forces"]] == [gravity.name]
+
+    for change in (
+        lambda: setattr(engine, "track_forces", False),
+        lambda: engine.remove_force(gravity),
+        lambda: engine.add_force(gravity),
+    ):
+        change()
+        assert engine.get_inventory_data() is not listed
+        listed = engine.get_inventory_data()
+    assert listed[0]["applied_forces"] == []
+
+
+def _step_once(engine: NumpyPhysicsEngine, use_numba: bool, monkeypatch) -> None:
+    with monkeypatch.context() as patch:
+        for module in _KERNEL_SWITCH_MODULES:
+            patch.setattr(module, "NUMBA_AVAILABLE", use_numba)
+        engine.step(1.0 / 60.0)
+
+
+def _ball_state(engine: NumpyPhysicsEngine) -> tuple[np.ndarray, np.ndarray]:
+    n = engine._n_dynamic
+    return engine._positions[:n].copy(), engine._velocities[:n].copy()
+
+
+def _build_random_scene(seed: int, friction_enabled: bool) -> NumpyPhysicsEngine:
+    # Balls sit on a jittered lattice, so ball-ball contacts come in
+    # isolated pairs; obstacles are scattered over them at random
+    rng = np.random.default_rng(seed)
+    engine = NumpyPhysicsEngine(bounds=(20.0, 20.0), track_forces=False)
+    engine.friction_enabled = friction_enabled
+    for x in np.arange(1.0, 19.5, 1.6):
+        for y in np.arange(1.0, 19.5, 1.6):
+            ball = _make_entity(EntityType.BALL, rng)
+            ball.position = np.array([x, y]) + rng.uniform(-0.35, 0.35, 2)
+            engine.add_entity(ball)
+    for kind in (EntityType.RECTANGLE_OBSTACLE, EntityType.CIRCLE_OBSTACLE):
+        for _ in range(12):
+            engine.add_entity(_make_entity(kind, rng))
+    return engine
+
+
+def _build_push_into_neighbour_scene(obstacle: EntityType) -> NumpyPhysicsEngine:
+    # The push out of the first obstacle moves the ball into the second
+    engine = NumpyPhysicsEngine(bounds=(20.0, 20.0), track_forces=False)
+    engine.friction_enabled = False
+    if obstacle == EntityType.RECTANGLE_OBSTACLE:
+        engine.add_entity(
+            Ball(
+                position=np.array([5.1844, 15.2610]),
+                velocity=np.array([1.70, -0.096]),
+                radius=0.3,
+            )
+        )
+        for center in ([5.7104, 15.4596], [4.3668, 15.1140]):
+            engine.add_entity(
+                RectangleObstacle(position=np.array(center), width=1.0, height=0.5)
+            )
+    else:
+        engine.add_entity(
+            Ball(
+                position=np.array([5.0, 5.0]),
+                velocity=np.array([1.0, 0.3]),
+                radius=0.3,
+            )
+        )
+        for center in ([5.5, 5.0], [4.4, 5.0]):
+            engine.add_entity(CircleObstacle(position=np.array(center), radius=0.3))
+    return engine
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: _build_random_scene(1, friction_enabled=False),
+        lambda: _build_random_scene(2, friction_enabled=True),
+        lambda: _build_push_into_neighbour_scene(EntityType.RECTANGLE_OBSTACLE),
+        lambda: _build_push_into_neighbour_scene(EntityType.CIRCLE_OBSTACLE),
+    ],
+    ids=["random", "random-friction", "rect-neighbour", "circle-neighbour"],
+)
+def test_numba_and_numpy_paths_agree_on_one_step(build, monkeypatch):
+    """The Numba kernels and the NumPy fallback resolve the same contacts."""
+    pytest.importorskip("numba")
+    compiled = build()
+    fallback = build()
+    _step_once(compiled, True, monkeypatch)
+    _step_once(fallback, False, monkeypatch)
+
+    compiled_positions, compiled_velocities = _ball_state(compiled)
+    fallback_positions, fallback_velocities = _ball_state(fallback)
+    np.testing.assert_allclose(compiled_positions, fallback_positions, atol=1e-4)
+    np.testing.assert_allclose(compiled_velocities, fallback_velocities, atol=1e-3)
+
+
+def _build_dense_cluster(seed: int, n_balls: int) -> NumpyPhysicsEngine:
+    # Heavily overlapping balls: corrections push balls into balls they
+    # were not touching, so later pairs depend on the earlier ones
+    rng = np.random.default_rng(seed)
+    box = 0.6 * np.sqrt(n_balls)
+    engine = NumpyPhysicsEngine(bounds=(box, box), track_forces=False)
+    engine.friction_enabled = True
+    for _ in range(n_balls):
+        engine.add_entity(
+            Ball(
+                position=rng.uniform(0.5, box - 0.5, 2),
+                velocity=rng.uniform(-3.0, 3.0, 2),
+                radius=float(rng.uniform(0.2, 0.5)),
+                mass=float(rng.uniform(0.5, 3.0)),
+                restitution=float(rng.uniform(0.5, 1.0)),
+                friction_coefficient=float(rng.uniform(0.0, 0.5)),
+            )
+        )
+    return engine
+
+
+# Ball counts on both sides of the NumPy and the Numba grid thresholds
+_DENSE_BALL_COUNTS = [
+    GRID_BROADPHASE_THRESHOLD // 3,
+    GRID_BROADPHASE_THRESHOLD + 72,
+    GRID_BROADPHASE_THRESHOLD_NUMBA + 76,
+]
+
+
+@pytest.mark.parametrize("n_balls", _DENSE_BALL_COUNTS)
+def test_grid_kernel_matches_the_full_pair_loop(n_balls):
+    """The Numba grid kernel resolves exactly the full loop's contacts."""
+    pytest.importorskip("numba")
+    from physics_sim.engines.numpy_engine import _kernels
+
+    engine = _build_dense_cluster(n_balls, n_balls)
+    n = engine._n_dynamic
+    results = []
+    for kernel in (_kernels.ball_ball_collisions, _kernels.ball_ball_grid_collisions):
+        positions = engine._positions[:n].copy()
+        velocities = engine._velocities[:n].copy()
+        kernel(
+            positions,
+            velocities,
+            engine._inv_masses[:n],
+            engine._ball_radius[:n],
+            engine._restitutions[:n],
+            engine._friction_coeffs[:n],
+            True,
+        )
+        results.append((positions, velocities))
+
+    (full_positions, full_velocities), (grid_positions, grid_velocities) = results
+    np.testing.assert_array_equal(grid_positions, full_positions)
+    np.testing.assert_array_equal(grid_velocities, full_velocities)
+
+
+@pytest.mark.parametrize("n_balls", _DENSE_BALL_COUNTS)
+def test_numba_and_numpy_agree_on_dense_clusters(n_balls, monkeypatch):
+    """Chains of corrections resolve the same on both ball-ball paths."""
+    pytest.importorskip("numba")
+    compiled = _build_dense_cluster(n_balls, n_balls)
+    fallback = _build_dense_cluster(n_balls, n_balls)
+    for engine, use_numba in ((compiled, True), (fallback, False)):
+        with monkeypatch.context() as patch:
+            patch.setattr(collision_mixin, "NUMBA_AVAILABLE", use_numba)
+            engine._handle_ball_ball_collisions_vectorized()
+
+    compiled_positions, compiled_velocities = _ball_state(compiled)
+    fallback_positions, fallback_velocities = _ball_state(fallback)
+    np.testing.assert_allclose(compiled_positions, fallback_positions, atol=1e-4)
+    np.testing.assert_allclose(compiled_velocities, fallback_velocities, atol=1e-3)
+
+
+@pytest.mark.parametrize("use_numba", [True, False], ids=["numba", "numpy"])
+@pytest.mark.parametrize(
+    "obstacle",
+    [EntityType.RECTANGLE_OBSTACLE, EntityType.CIRCLE_OBSTACLE],
+    ids=["rect", "circle"],
+)
+def test_obstacle_friction_uses_the_obstacle_row(obstacle, use_numba, monkeypatch):
+    """Friction against an obstacle mixes in that obstacle's own coefficient."""
+    if use_numba:
+        pytest.importorskip("numba")
+    engine = NumpyPhysicsEngine(bounds=(20.0, 20.0), track_forces=False)
+    # Sliding along +x while sinking 0.05 into a surface with normal +y
+    engine.add_entity(
+        Ball(
+            position=np.array([5.0, 5.25]),
+            velocity=np.array([2.0, -1.0]),
+            radius=0.3,
+            restitution=1.0,
+            friction_coefficient=0.5,
+        )
+    )
+    # A far-away decoy with a different coefficient comes first in the block
+    if obstacle == EntityType.RECTANGLE_OBSTACLE:
+        for center, friction in (([15.0, 15.0], 0.9), ([5.0, 4.75], 0.1)):
+            engine.add_entity(
+                RectangleObstacle(
+                    position=np.array(center),
+                    width=4.0,
+                    height=0.5,
+                    friction_coefficient=friction,
+                )
+            )
+    else:
+        for center, friction in (([15.0, 15.0], 0.9), ([5.0, 4.7], 0.1)):
+            engine.add_entity(
+                CircleObstacle(
+                    position=np.array(center),
+                    radius=0.3,
+                    friction_coefficient=friction,
+                )
+            )
+
+    with monkeypatch.context() as patch:
+        patch.setattr(collision_mixin, "NUMBA_AVAILABLE", use_numba)
+        engine._handle_ball_obstacle_collisions_vectorized()
+
+    # Normal speed 1 is reflected; friction removes mu * (1 + e) * 1 of the
+    # tangential speed, with mu the mean of the ball's 0.5 and the 0.1 of
+    # the obstacle it touched
+    mu = (0.5 + 0.1) / 2.0
+    np.testing.assert_allclose(engine._velocities[0], [2.0 - mu * 2.0, 1.0], atol=1e-5)